@@ -1,98 +1,248 @@
 import heapq
 from termcolor import colored
-import time
+import tracemalloc
 
-# Class to represent the state of the 8-puzzle
+from heuristics import HEURISTICS, STANDARD_INSTANCES, get_heuristic
+from puzzle import EIGHT, puzzle_for
+from search_stats import DISABLED, SearchStats
+
+# Class to represent the state of the puzzle
 class PuzzleState:
-    def __init__(self, board, parent, move, depth, cost):
-        self.board = board  # The puzzle board configuration
+    __slots__ = ("board", "parent", "move", "depth", "cost", "blank")
+
+    def __init__(self, board, parent, move, depth, cost, blank):
+        self.board = board  # The puzzle board configuration, packed into one int
         self.parent = parent  # Parent state
         self.move = move  # Move to reach this state
         self.depth = depth  # Depth in the search tree
         self.cost = cost  # Cost (depth + heuristic)
+        self.blank = blank  # Position of the blank tile
 
     def __lt__(self, other):
         return self.cost < other.cost
 
+# Priority queue for small integer f values: one bucket per f, and inside it one
+# stack per g, so pop takes the lowest f and, among equal f, the highest g (the
+# node closest to the goal by its own estimate), newest first.
+class BucketQueue:
+    __slots__ = ("buckets", "top_g", "min_f", "size")
+
+    def __init__(self):
+        self.buckets = []  # buckets[f][g] is a stack of nodes
+        self.top_g = []  # top_g[f] bounds the highest non-empty g in buckets[f]
+        self.min_f = 0
+        self.size = 0
+
+    def push(self, node, f, g):
+        while len(self.buckets) <= f:
+            self.buckets.append([])
+            self.top_g.append(-1)
+        bucket = self.buckets[f]
+        while len(bucket) <= g:
+            bucket.append([])
+        bucket[g].append(node)
+        if g > self.top_g[f]:
+            self.top_g[f] = g
+        if f < self.min_f or self.size == 0:
+            self.min_f = f
+        self.size += 1
+
+    def pop(self):
+        f = self.min_f
+        while self.top_g[f] < 0:
+            f += 1
+        bucket, g = self.buckets[f], self.top_g[f]
+        while not bucket[g]:
+            g -= 1
+        node = bucket[g].pop()
+        self.size -= 1
+        while g >= 0 and not bucket[g]:
+            g -= 1
+        self.top_g[f] = g
+        self.min_f = f
+        return node
+
+    def __len__(self):
+        return self.size
+
 # Function to display the board in a visually appealing format
 def print_board(board):
-    print("+---+---+---+")
-    for row in range(0, 9, 3):
+    puzzle = puzzle_for(board)
+    cell = len(str(puzzle.size - 1))
+    border = "+" + ("-" * (cell + 2) + "+") * puzzle.width
+    print(border)
+    for row in range(0, puzzle.size, puzzle.width):
         row_visual = "|"
-        for tile in board[row:row + 3]:
+        for tile in board[row:row + puzzle.width]:
             if tile == 0:  # Blank tile
-                row_visual += f" {colored(' ', 'cyan')} |"
+                row_visual += f" {colored(' ' * cell, 'cyan')} |"
             else:
-                row_visual += f" {colored(str(tile), 'yellow')} |"
+                row_visual += f" {colored(str(tile).rjust(cell), 'yellow')} |"
         print(row_visual)
-        print("+---+---+---+")
-
-# Goal state for the puzzle
-goal_state = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        print(border)
 
-# Possible moves for the blank tile (up, down, left, right)
-moves = {
-    'U': -3,  # Move up
-    'D': 3,   # Move down
-    'L': -1,  # Move left
-    'R': 1    # Move right
-}
+# Goal state for the 8-puzzle (other sizes use the same layout: 1..N-1 then the blank)
+goal_state = EIGHT.goal_board
 
 # Heuristic: number of misplaced tiles
 def heuristic(board):
-    return sum(1 for i in range(9) if board[i] != 0 and board[i] != goal_state[i])
+    puzzle = puzzle_for(board)
+    return puzzle.misplaced(puzzle.pack(board), board.index(0))
 
-# Function to get the new state after a move
-def move_tile(board, move, blank_pos):
-    new_board = board[:]
-    new_blank_pos = blank_pos + moves[move]
-    new_board[blank_pos], new_board[new_blank_pos] = new_board[new_blank_pos], new_board[blank_pos]
-    return new_board
+# A* search algorithm (8-, 15- and 24-puzzles; states are packed ints, see puzzle.py)
+# The frontier is a BucketQueue on f with ties to the higher g. best_g holds the
+# cheapest g found per state: a child is only queued if it improves on it, and a
+# popped node whose g has since been beaten is skipped (lazy deletion).
+# `heuristic` is one of heuristics.HEURISTICS; `stats` is an optional SearchStats.
+# Unsolvable starts return None straight away, by parity, instead of exhausting the space.
+def a_star(start_state, heuristic="misplaced", stats=None):
+    stats = DISABLED if stats is None else stats
+    puzzle = puzzle_for(start_state)
+    if not puzzle.is_solvable(start_state):
+        return None
+    h = get_heuristic(heuristic, puzzle)
+    open_list = BucketQueue()
+    start = puzzle.pack(start_state)
+    start_h = h.initial(start)
+    open_list.push(PuzzleState(start, None, None, 0, start_h, start_state.index(0)), start_h, 0)
+    best_g = {start: 0}
+    expanded = generated = duplicates = peak_frontier = 0
+    track = stats.enabled
 
-# A* search algorithm
-def a_star(start_state):
+    with stats.phase("search"):
+        while open_list:
+            current_state = open_list.pop()
+            depth = current_state.depth
+            if best_g[current_state.board] < depth:
+                duplicates += 1
+                continue  # superseded by a cheaper path to the same board
+
+            if current_state.board == puzzle.goal:
+                break
+
+            expanded += 1
+            current_h = current_state.cost - depth
+            child_depth = depth + 1
+
+            for move, new_board, new_blank in puzzle.successors(current_state.board, current_state.blank):
+                if best_g.get(new_board, child_depth + 1) <= child_depth:
+                    duplicates += 1
+                    continue
+                best_g[new_board] = child_depth
+
+                # The tile at new_blank slid into the old blank position
+                tile = puzzle.tile_at(current_state.board, new_blank)
+                new_h = h.update(current_state.board, new_board, current_h, tile, new_blank, current_state.blank)
+                new_state = PuzzleState(new_board, current_state, move, child_depth, child_depth + new_h, new_blank)
+                open_list.push(new_state, new_state.cost, child_depth)
+                generated += 1
+            if track and len(open_list) > peak_frontier:
+                peak_frontier = len(open_list)
+        else:
+            current_state = None
+
+    stats.count(generated, expanded, duplicates)
+    stats.observe(peak_frontier, len(best_g))
+    if current_state is not None:
+        stats.solution(current_state.depth)
+    return current_state
+
+# The previous A*: a binary heap ordered on f alone and a closed set, with no check
+# for a better g already queued. Kept to compare against `a_star`; same arguments.
+def a_star_heapq(start_state, heuristic="misplaced", stats=None):
+    stats = DISABLED if stats is None else stats
+    puzzle = puzzle_for(start_state)
+    if not puzzle.is_solvable(start_state):
+        return None
+    h = get_heuristic(heuristic, puzzle)
     open_list = []
     closed_list = set()
-    heapq.heappush(open_list, PuzzleState(start_state, None, None, 0, heuristic(start_state)))
+    start = puzzle.pack(start_state)
+    heapq.heappush(open_list, PuzzleState(start, None, None, 0, h.initial(start), start_state.index(0)))
+    expanded = generated = duplicates = peak_frontier = 0
+    track = stats.enabled
+
+    with stats.phase("search"):
+        while open_list:
+            current_state = heapq.heappop(open_list)
 
-    while open_list:
-        current_state = heapq.heappop(open_list)
+            if current_state.board == puzzle.goal:
+                break
 
-        if current_state.board == goal_state:
-            return current_state
+            closed_list.add(current_state.board)
+            expanded += 1
+            current_h = current_state.cost - current_state.depth
 
-        closed_list.add(tuple(current_state.board))
+            for move, new_board, new_blank in puzzle.successors(current_state.board, current_state.blank):
+                if new_board in closed_list:
+                    duplicates += 1
+                    continue
 
-        blank_pos = current_state.board.index(0)
+                # The tile at new_blank slid into the old blank position
+                tile = puzzle.tile_at(current_state.board, new_blank)
+                new_h = h.update(current_state.board, new_board, current_h, tile, new_blank, current_state.blank)
+                new_state = PuzzleState(
+                    new_board,
+                    current_state,
+                    move,
+                    current_state.depth + 1,
+                    current_state.depth + 1 + new_h,
+                    new_blank
+                )
+                heapq.heappush(open_list, new_state)
+                generated += 1
+            if track and len(open_list) > peak_frontier:
+                peak_frontier = len(open_list)
+        else:
+            current_state = None
 
-        for move in moves:
-            if move == 'U' and blank_pos < 3:  # Invalid move up
-                continue
-            if move == 'D' and blank_pos > 5:  # Invalid move down
-                continue
-            if move == 'L' and blank_pos % 3 == 0:  # Invalid move left
-                continue
-            if move == 'R' and blank_pos % 3 == 2:  # Invalid move right
-                continue
+    stats.count(generated, expanded, duplicates)
+    stats.observe(peak_frontier, len(closed_list))
+    if current_state is not None:
+        stats.solution(current_state.depth)
+    return current_state
 
-            new_board = move_tile(current_state.board, move, blank_pos)
+# Compare nodes expanded per heuristic on a set of (board, optimal length) instances
+def compare_heuristics(instances=STANDARD_INSTANCES, names=tuple(HEURISTICS)):
+    totals = {}
+    for name in names:
+        totals[name] = 0
+        for board, optimal in instances:
+            stats = SearchStats()
+            solution = a_star(board, name, stats)
+            if solution is None or solution.depth != optimal:
+                raise AssertionError(f"{name} found a non-optimal solution for {board}")
+            totals[name] += stats.expanded
 
-            if tuple(new_board) in closed_list:
-                continue
+    baseline = totals[names[0]]
+    for name in names:
+        reduction = 1 - totals[name] / baseline if baseline else 0.0
+        print(f"{name:16} {totals[name]:10} nodes expanded ({reduction:.1%} fewer than {names[0]})")
+    return totals
 
-            new_state = PuzzleState(
-                new_board,
-                current_state,
-                move,
-                current_state.depth + 1,
-                current_state.depth + 1 + heuristic(new_board)
-            )
-            heapq.heappush(open_list, new_state)
+# Compare `a_star` with `a_star_heapq`: nodes expanded, peak traced memory and wall time
+def compare_open_lists(instances=STANDARD_INSTANCES, heuristic="manhattan"):
+    results = {}
+    for solver in (a_star_heapq, a_star):
+        stats = SearchStats()
+        peak = 0
+        for board, optimal in instances:
+            solution = solver(board, heuristic, stats)
+            if solution is None or solution.depth != optimal:
+                raise AssertionError(f"{solver.__name__} found a non-optimal solution for {board}")
 
-    return None
+            # Second run under tracemalloc, which would distort the timing
+            tracemalloc.start()
+            solver(board, heuristic)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        expanded, seconds = stats.expanded, stats.timings_ns["search"] / 1e9
+        results[solver.__name__] = {"expanded": expanded, "peak_bytes": peak, "seconds": seconds}
+        print(f"{solver.__name__:12} {expanded:9} nodes expanded, peak {peak / 1024:8.0f} KiB, {seconds:.3f}s")
+    return results
 
 # Function to print the solution path
-def print_solution(solution):
+def print_solution(solution, puzzle=EIGHT):
     path = []
     current = solution
     while current:
@@ -102,24 +252,30 @@ def print_solution(solution):
 
     for step in path:
         print(f"Move: {step.move}")
-        print_board(step.board)
+        print_board(puzzle.unpack(step.board))
 
-# Initial state of the puzzle
-initial_state = [1, 2, 3, 4, 8, 0, 7, 6, 5]
+if __name__ == "__main__":
+    # Initial state of the puzzle
+    initial_state = [1, 2, 3, 4, 8, 0, 7, 6, 5]
 
-# Solve the puzzle using A* algorithm
-start_time = time.time()
-solution = a_star(initial_state)
-end_time = time.time()
+    # Solve the puzzle using A* algorithm
+    stats = SearchStats()
+    solution = a_star(initial_state, stats=stats)
+    runtime = stats.timings_ns.get("search", 0) / 1e9
 
-runtime = end_time - start_time
+    # Print the solution
+    if solution:
+        print(colored("Solution found:", "green"))
+        print_solution(solution, puzzle_for(initial_state))
+        print(colored(f"Runtime: {runtime:.6f} seconds", "cyan"))
+        print(colored(f"Nodes expanded: {stats.expanded}, generated: {stats.generated}, "
+                      f"effective branching factor: {stats.branching_factor() or 0:.2f}", "cyan"))
+    else:
+        print(colored("No solution exists.", "red"))
+        print(colored(f"Runtime: {runtime:.6f} seconds", "cyan"))
 
+    # Nodes expanded by each heuristic on the standard instance set
+    compare_heuristics()
 
-# Print the solution
-if solution:
-    print(colored("Solution found:", "green"))
-    print_solution(solution)
-    print(colored(f"Runtime: {runtime:.6f} seconds", "cyan"))
-else:
-    print(colored("No solution exists.", "red"))
-    print(colored(f"Runtime: {runtime:.6f} seconds", "cyan"))
+    # Bucket queue with best-g duplicate detection against the previous heapq A*
+    compare_open_lists()
@@ -1,13 +1,16 @@
-import copy
 import time
 
+from bidirectional import bidirectional_bfs
+from heuristics import get_heuristic
+from puzzle import REVERSE, puzzle_for
+from search_stats import DISABLED, SearchStats
+
 # Define the goal state
 GOAL_STATE =[[1, 2, 3],
               [4, 5, 6],
-              [7, 8, 0]] 
+              [7, 8, 0]]
 
-# Directions: up, down, left, right
-DIRS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+FOUND = -1
 
 def find_zero(state):
     for i in range(3):
@@ -19,67 +22,180 @@ def find_zero(state):
 def is_goal(state):
     return state == GOAL_STATE
 
-def get_neighbors(state):
-    neighbors = []
-    x, y = find_zero(state)
+# Flatten a grid (list of rows) into one list; flat boards pass through
+def flatten(state):
+    if state and isinstance(state[0], list):
+        return [tile for row in state for tile in row]
+    return list(state)
+
+# Plain iterative deepening is IDA* with h = 0
+class Blind:
+    def initial(self, state):
+        return 0
+
+    def update(self, parent, child, h, tile, src, dst):
+        return 0
+
+# IDA*: depth-first search bounded on f = g + h, raising the bound to the smallest
+# f that exceeded it until the goal is reached. There is one board, a packed int
+# (see puzzle.py), and a move is applied and undone by the same XOR slide, so
+# nothing is copied; memory is the recursion and the move stack, linear in depth.
+# The reverse of the last move is never tried. Returns the list of blank moves.
+# `heuristic` is a heuristics.HEURISTICS name or None for blind deepening; `stats`
+# (a SearchStats) gets one iteration per bound, with the deepest path as peak frontier.
+# Unsolvable starts return None, by parity, since the bound would grow forever.
+def ida_star(start_state, heuristic="manhattan", stats=None):
+    stats = DISABLED if stats is None else stats
+    board = flatten(start_state)
+    puzzle = puzzle_for(board)
+    if not puzzle.is_solvable(board):
+        return None
+    h = get_heuristic(heuristic, puzzle) if heuristic else Blind()
+    state = puzzle.pack(board)
+    moves = []
+    generated = expanded = duplicates = deepest = 0
 
-    for dx, dy in DIRS:
-        nx, ny = x + dx, y + dy
-        if 0 <= nx < 3 and 0 <= ny < 3:
-            new_state = copy.deepcopy(state)
-            new_state[x][y], new_state[nx][ny] = new_state[nx][ny], new_state[x][y]
-            neighbors.append(new_state)
-    return neighbors
+    def search(blank, g, h_value, bound, last):
+        nonlocal state, generated, expanded, duplicates, deepest
+        f = g + h_value
+        if f > bound:
+            return f
+        if state == puzzle.goal:
+            return FOUND
+        expanded += 1
+        if g > deepest:
+            deepest = g
+        minimum = float("inf")
+        for move, target in puzzle.moves[blank]:
+            if move == last:
+                duplicates += 1
+                continue
+            parent = state
+            tile = puzzle.tile_at(parent, target)
+            state = puzzle.slide(parent, blank, target)  # apply
+            generated += 1
+            moves.append(move)
+            t = search(target, g + 1, h.update(parent, state, h_value, tile, target, blank), bound, REVERSE[move])
+            if t == FOUND:
+                return FOUND
+            moves.pop()
+            state = puzzle.slide(state, target, blank)  # undo
+            if t < minimum:
+                minimum = t
+        return minimum
 
-def iddfs(start_state):
-    depth = 0
+    blank = board.index(0)
+    h_start = h.initial(state)
+    bound = h_start
     while True:
-        visited = set()
-        path = []
-        found, result_path = dls(start_state, depth, visited, path)
-        if found:
-            return result_path
-        depth += 1
-
-def dls(state, depth, visited, path):
-    state_key = str(state)
-    if state_key in visited:
-        return False, []
-    visited.add(state_key)
-    path.append(state)
-
-    if is_goal(state):
-        return True, path
-
-    if depth == 0:
-        path.pop()
-        return False, []
-
-    for neighbor in get_neighbors(state):
-        found, result_path = dls(neighbor, depth - 1, visited, path)
-        if found:
-            return True, result_path
-
-    path.pop()
-    return False, []
-
-# Example usage:
-start_state = [[1, 2, 3],
-               [0, 4, 6],
-               [7, 5, 8]]
-
-start_time = time.time()
-solution_path = iddfs(start_state)
-end_time = time.time()
-runtime = end_time - start_time
-
-if solution_path:
-    print("Solution found in", len(solution_path) - 1, "moves.")
-    for step in solution_path:
-        for row in step:
-            print(row)
-        print()
-    print(f"Runtime: {runtime:.6f} seconds")
-else:
-    print("No solution found.")
-    print(f"Runtime: {runtime:.6f} seconds")
+        start_ns = time.perf_counter_ns()
+        t = search(blank, 0, h_start, bound, None)
+        stats.iteration(bound, generated, expanded, time.perf_counter_ns() - start_ns)
+        stats.count(duplicates=duplicates)
+        generated = expanded = duplicates = 0
+        if t == FOUND:
+            break
+        bound = t
+
+    stats.observe(deepest + 1)
+    stats.solution(len(moves))
+    return moves
+
+# Replay blank moves from a start state, returning every state on the way as a grid
+def apply_moves(start_state, moves):
+    board = flatten(start_state)
+    puzzle = puzzle_for(board)
+    steps = {"U": -puzzle.width, "D": puzzle.width, "L": -1, "R": 1}
+    blank = board.index(0)
+    path = [board[:]]
+    for move in moves:
+        target = blank + steps[move]
+        board[blank], board[target] = board[target], board[blank]
+        blank = target
+        path.append(board[:])
+    return [[b[i:i + puzzle.width] for i in range(0, puzzle.size, puzzle.width)] for b in path]
+
+# Iterative deepening without a heuristic; returns the states from start to goal,
+# or None if the start is unsolvable. `bidirectional` swaps in a bidirectional BFS
+# that meets in the middle at GOAL_STATE (see bidirectional.py).
+def iddfs(start_state, stats=None, bidirectional=False):
+    if bidirectional:
+        moves = bidirectional_bfs(flatten(start_state), stats)
+    else:
+        moves = ida_star(start_state, None, stats)
+    return None if moves is None else apply_moves(start_state, moves)
+
+# Depth-limited search from `state`: the path of states to the goal within
+# `depth` moves, or None. This is one iteration of `iddfs`; `stats` is a SearchStats.
+def dls(state, depth, stats=None):
+    stats = DISABLED if stats is None else stats
+    board = flatten(state)
+    puzzle = puzzle_for(board)
+    packed = puzzle.pack(board)
+    moves = []
+    generated = expanded = 0
+
+    def search(blank, depth, last):
+        nonlocal packed, generated, expanded
+        if packed == puzzle.goal:
+            return True
+        if depth == 0:
+            return False
+        expanded += 1
+        for move, target in puzzle.moves[blank]:
+            if move == last:
+                continue
+            packed = puzzle.slide(packed, blank, target)
+            moves.append(move)
+            generated += 1
+            if search(target, depth - 1, REVERSE[move]):
+                return True
+            moves.pop()
+            packed = puzzle.slide(packed, target, blank)
+        return False
+
+    start_ns = time.perf_counter_ns()
+    found = search(board.index(0), depth, None)
+    stats.iteration(depth, generated, expanded, time.perf_counter_ns() - start_ns)
+    if found:
+        stats.solution(len(moves))
+        return apply_moves(state, moves)
+    return None
+
+if __name__ == "__main__":
+    # Example usage:
+    start_state = [[1, 2, 3],
+                   [0, 4, 6],
+                   [7, 5, 8]]
+
+    stats = SearchStats()
+    solution_path = iddfs(start_state, stats)
+    runtime = sum(iteration["ns"] for iteration in stats.iterations) / 1e9
+
+    if solution_path:
+        print("Solution found in", len(solution_path) - 1, "moves.")
+        for step in solution_path:
+            for row in step:
+                print(row)
+            print()
+        print(f"Runtime: {runtime:.6f} seconds")
+    else:
+        print("No solution found.")
+        print(f"Runtime: {runtime:.6f} seconds")
+
+    # A harder instance (31 moves) with IDA* and the Manhattan heuristic
+    hard_state = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+    stats = SearchStats()
+    moves = ida_star(hard_state, "manhattan", stats)
+    runtime = sum(iteration["ns"] for iteration in stats.iterations) / 1e9
+    bounds = [iteration["limit"] for iteration in stats.iterations]
+    print(f"IDA* solved {hard_state} in {len(moves)} moves: {''.join(moves)}")
+    print(f"{stats.generated} nodes generated over bounds {bounds} in {runtime:.3f} seconds "
+          f"(effective branching factor {stats.branching_factor():.2f})")
+
+    # The same instance searched from both ends
+    stats = SearchStats()
+    solution_path = iddfs(hard_state, stats, bidirectional=True)
+    runtime = stats.timings_ns["search"] / 1e9
+    print(f"Bidirectional BFS: {len(solution_path) - 1} moves, expanded {stats.details['forward_expanded']} forward "
+          f"+ {stats.details['backward_expanded']} backward in {runtime:.3f} seconds")
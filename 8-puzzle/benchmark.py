@@ -0,0 +1,205 @@
+"""Benchmark the 8-puzzle solvers on a depth-bucketed corpus (see corpus.py).
+
+    python corpus.py --output corpus.jsonl
+    python benchmark.py corpus.jsonl --timeout 10 --output report.json
+    python benchmark.py corpus.jsonl --solvers a_star ida_star ids_engine --no-memory
+
+Every (solver, instance) run happens in its own subprocess, killed after
+--timeout seconds. Each (solver, depth) cell reports how many instances were
+solved or timed out, mean nodes generated and expanded, p50/p95 time and the
+peak traced memory (from a second, traced run; timed runs are not traced).
+A solution whose length differs from the corpus depth is non-optimal and makes
+the run exit non-zero. Once a solver times out on a whole bucket, its deeper
+buckets are skipped unless --keep-going is given.
+"""
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import Code
+import bidirectional
+import distance_table
+from corpus import read_corpus
+from search_stats import SearchStats
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import iddfs as ids_engine  # the root-level iterative-deepening engine
+
+a_star_module = importlib.import_module("A* using misplaced tiles heuristics")
+
+GOAL_GRID = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def _length(moves):
+    return None if moves is None else len(moves)
+
+
+def _a_star(heuristic):
+    def solve(board, stats):
+        solution = a_star_module.a_star(board, heuristic, stats)
+        return None if solution is None else solution.depth
+    return solve
+
+
+def _iddfs(board, stats):
+    path = Code.iddfs(board, stats)
+    return None if path is None else len(path) - 1
+
+
+def _ids_engine(board, stats):
+    grid = [board[i:i + 3] for i in range(0, 9, 3)]
+    return _length(ids_engine.iterative_deepening(grid, GOAL_GRID, blank=0, stats=stats)[0])
+
+
+# Each solver takes (flat board, SearchStats) and returns its solution length
+SOLVERS = {
+    "a_star": _a_star("misplaced"),
+    "a_star_manhattan": _a_star("manhattan"),
+    "ida_star": lambda board, stats: _length(Code.ida_star(board, "manhattan", stats)),
+    "iddfs": _iddfs,
+    "ids_engine": _ids_engine,
+    "bidirectional_bfs": lambda board, stats: _length(bidirectional.bidirectional_bfs(board, stats)),
+    "distance_table": lambda board, stats: _length(distance_table.solve(board)),
+}
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a list, or None when it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-q * len(ordered) // 100))  # ceil(q/100 * len)
+    return ordered[int(rank) - 1]
+
+
+def _worker(name, board, conn, trace_memory):
+    """Subprocess body: send the timed result, then optionally the traced peak."""
+    solve = SOLVERS[name]
+    stats = SearchStats()
+    start = time.perf_counter()
+    length = solve(board, stats)
+    conn.send({"length": length, "seconds": time.perf_counter() - start,
+               "generated": stats.generated, "expanded": stats.expanded})
+    if trace_memory:
+        tracemalloc.start()
+        solve(board, SearchStats(enabled=False))
+        conn.send(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+
+
+def run_instance(name, board, timeout, trace_memory=True):
+    """One solver run in a subprocess; None if it did not finish within `timeout`.
+
+    The traced run gets its own `timeout`; if it overruns, memory is None.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_worker, args=(name, board, sender, trace_memory), daemon=True)
+    process.start()
+    sender.close()
+    result = None
+    try:
+        if receiver.poll(timeout):
+            result = receiver.recv()
+            result["peak_memory_kib"] = None
+            if trace_memory and receiver.poll(timeout):
+                result["peak_memory_kib"] = receiver.recv()
+    except EOFError:
+        pass  # the worker died before reporting
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        receiver.close()
+    return result
+
+
+def benchmark_cell(name, depth, instances, timeout, trace_memory):
+    runs = [run_instance(name, instance["board"], timeout, trace_memory) for instance in instances]
+    finished = [run for run in runs if run is not None]
+    nonoptimal = [instance["id"] for instance, run in zip(instances, runs)
+                  if run is not None and run["length"] != depth]
+    times = [run["seconds"] for run in finished]
+    memory = [run["peak_memory_kib"] for run in finished if run["peak_memory_kib"] is not None]
+
+    def mean(key):
+        return sum(run[key] for run in finished) / len(finished) if finished else None
+
+    return {
+        "solver": name,
+        "depth": depth,
+        "runs": len(runs),
+        "solved": len(finished),
+        "timeouts": len(runs) - len(finished),
+        "nonoptimal": nonoptimal,
+        "mean_generated": mean("generated"),
+        "mean_expanded": mean("expanded"),
+        "time": {f"p{q}": percentile(times, q) for q in (50, 95)},
+        "peak_memory_kib": max(memory) if memory else None,
+    }
+
+
+def run_benchmark(corpus, solvers, timeout, trace_memory=True, keep_going=False):
+    buckets = {}
+    for instance in corpus:
+        buckets.setdefault(instance["depth"], []).append(instance)
+
+    results = []
+    for name in solvers:
+        for depth in sorted(buckets):
+            cell = benchmark_cell(name, depth, buckets[depth], timeout, trace_memory)
+            p50 = f"{cell['time']['p50']:.4f}s" if cell["time"]["p50"] is not None else "-"
+            nodes = f"{cell['mean_generated']:12.0f}" if cell["mean_generated"] is not None else f"{'-':>12}"
+            memory = f"{cell['peak_memory_kib']:9.1f} KiB" if cell["peak_memory_kib"] is not None else f"{'-':>13}"
+            flag = "❌" if cell["nonoptimal"] else "✅" if not cell["timeouts"] else "⏱️"
+            print(f"{flag} {name:18} depth {depth:2} | solved {cell['solved']}/{cell['runs']} | "
+                  f"p50 {p50:>10} | {nodes} generated | {memory}")
+            results.append(cell)
+            if cell["solved"] == 0 and not keep_going:
+                print(f"   {name} timed out on every depth-{depth} instance; skipping deeper buckets")
+                break
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "timeout": timeout,
+            "instances": len(corpus),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("corpus", help="JSONL corpus from corpus.py")
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per run (default 10)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced memory runs")
+    parser.add_argument("--keep-going", action="store_true", help="run deeper buckets after a solver times out")
+    parser.add_argument("--output", help="write the JSON report here")
+    args = parser.parse_args(argv)
+
+    with open(args.corpus) as f:
+        corpus = read_corpus(f)
+    report = run_benchmark(corpus, args.solvers, args.timeout, not args.no_memory, args.keep_going)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    nonoptimal = [(cell["solver"], instance) for cell in report["results"] for instance in cell["nonoptimal"]]
+    for solver, instance in nonoptimal:
+        print(f"❌ {solver} returned a non-optimal solution for {instance}")
+    if nonoptimal:
+        return 1
+    print("✅ Every finished solution was optimal.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Bidirectional search for the sliding puzzles: meet in the middle at the goal.
+
+One search runs forward from the start and one backward from the goal, and
+the path is stitched together where they meet. Each side only has to reach
+about half the solution depth, so on deep instances the two frontiers together
+hold roughly the square root of what a forward search explores.
+
+Both functions return the list of blank moves from start to goal (None if the
+start is unsolvable), and fill an optional SearchStats, with the nodes expanded
+on each side in its details.
+"""
+import heapq
+import time
+
+from heuristics import Manhattan, get_heuristic
+from puzzle import REVERSE, puzzle_for, relabel
+from search_stats import DISABLED, SearchStats
+
+
+def _trace(parents, state):
+    """Moves from a side's root to `state`, following its parent links."""
+    moves = []
+    while parents[state] is not None:
+        state, move = parents[state][:2]
+        moves.append(move)
+    moves.reverse()
+    return moves
+
+
+def _stitch(forward, backward, meet):
+    """Forward moves to `meet`, then the backward side's moves to it undone in reverse."""
+    return _trace(forward, meet) + [REVERSE[move] for move in reversed(_trace(backward, meet))]
+
+
+def _record(stats, expanded, peak_frontier, parents, moves):
+    stats.detail(forward_expanded=expanded[0], backward_expanded=expanded[1])
+    stats.observe(peak_frontier, len(parents[0]) + len(parents[1]))
+    if moves is not None:
+        stats.solution(len(moves))
+
+
+def bidirectional_bfs(start_state, stats=None, goal_state=None, blank=0):
+    """Breadth-first from both ends, a whole layer at a time on the smaller frontier.
+
+    A layer is finished even after the first meeting so the shortest of its
+    meetings is kept, which makes the stitched path optimal. `goal_state` is
+    any flat board of the same tiles (default: the standard goal) and `blank`
+    the value marking the empty square in both boards. `stats` gets one
+    iteration per layer, whose limit is the two sides' combined depth.
+    """
+    stats = DISABLED if stats is None else stats
+    puzzle = puzzle_for(start_state)
+    if goal_state is None and blank == 0:
+        board, target = start_state, puzzle.goal_board
+    else:
+        board, target = relabel(start_state, goal_state or puzzle.goal_board, blank)
+    if not puzzle.reachable(board, target):
+        return None
+    start, goal = puzzle.pack(board), puzzle.pack(target)
+    # parents[side][state] = (parent, move, depth), None at the root
+    parents = ({start: None}, {goal: None})
+    frontiers = ([(start, board.index(0))], [(goal, target.index(0))])
+    depths = [0, 0]
+    expanded = [0, 0]
+    duplicates = peak_frontier = 0
+    meet = start if start == goal else None
+
+    with stats.phase("search"):
+        while meet is None and frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            seen, other = parents[side], parents[1 - side]
+            depth = depths[side] + 1
+            best = None
+            layer = []
+            layer_start = time.perf_counter_ns()
+            layer_expanded = len(frontiers[side])
+            expanded[side] += layer_expanded
+            for state, state_blank in frontiers[side]:
+                for move, child, child_blank in puzzle.successors(state, state_blank):
+                    if child in seen:
+                        duplicates += 1
+                        continue
+                    seen[child] = (state, move, depth)
+                    layer.append((child, child_blank))
+                    if child in other:
+                        total = depth + (other[child][2] if other[child] else 0)
+                        if best is None or total < best:
+                            best, meet = total, child
+            frontiers[side][:] = layer
+            depths[side] = depth
+            stats.iteration(depths[0] + depths[1], len(layer), layer_expanded,
+                            time.perf_counter_ns() - layer_start)
+            peak_frontier = max(peak_frontier, len(frontiers[0]) + len(frontiers[1]))
+
+    moves = None if meet is None else _stitch(parents[0], parents[1], meet)
+    stats.count(duplicates=duplicates)
+    _record(stats, expanded, peak_frontier, parents, moves)
+    return moves
+
+
+def bidirectional_a_star(start_state, stats=None):
+    """Front-to-end bidirectional A* with Manhattan distance towards each side's target.
+
+    Each step expands the side with the smaller open list. `best` is the cheapest
+    path through any state both sides have reached; the search stops once it is
+    no more than the lowest f on either open list, since every path still
+    undiscovered costs at least that much.
+    """
+    stats = DISABLED if stats is None else stats
+    puzzle = puzzle_for(start_state)
+    if not puzzle.is_solvable(start_state):
+        return None
+    start = puzzle.pack(start_state)
+    heuristics = (get_heuristic("manhattan", puzzle), Manhattan(puzzle, start_state))
+    roots = ((start, start_state.index(0)), (puzzle.goal, puzzle.goal_blank))
+    best_g = ({start: 0}, {puzzle.goal: 0})
+    parents = ({start: None}, {puzzle.goal: None})
+    # open lists hold (f, -g, state, blank): lowest f first, ties to the higher g
+    open_lists = []
+    for h, (state, blank) in zip(heuristics, roots):
+        open_lists.append([(h.initial(state), 0, state, blank)])
+    expanded = [0, 0]
+    generated = duplicates = peak_frontier = 0
+    track = stats.enabled
+    best, meet = (0, start) if start == puzzle.goal else (float("inf"), None)
+
+    with stats.phase("search"):
+        while open_lists[0] and open_lists[1]:
+            if best <= max(open_lists[0][0][0], open_lists[1][0][0]):
+                break
+            side = 0 if len(open_lists[0]) <= len(open_lists[1]) else 1
+            h, open_list, g_side, g_other = heuristics[side], open_lists[side], best_g[side], best_g[1 - side]
+            f, neg_g, state, blank = heapq.heappop(open_list)
+            g = -neg_g
+            if g_side[state] < g:
+                duplicates += 1
+                continue  # superseded by a cheaper path to the same board
+            expanded[side] += 1
+            h_value = f - g
+
+            for move, child, child_blank in puzzle.successors(state, blank):
+                child_g = g + 1
+                if g_side.get(child, child_g + 1) <= child_g:
+                    duplicates += 1
+                    continue
+                g_side[child] = child_g
+                parents[side][child] = (state, move)
+                tile = puzzle.tile_at(state, child_blank)
+                child_h = h.update(state, child, h_value, tile, child_blank, blank)
+                heapq.heappush(open_list, (child_g + child_h, -child_g, child, child_blank))
+                generated += 1
+                if child in g_other and child_g + g_other[child] < best:
+                    best, meet = child_g + g_other[child], child
+            if track and len(open_lists[0]) + len(open_lists[1]) > peak_frontier:
+                peak_frontier = len(open_lists[0]) + len(open_lists[1])
+
+    moves = None if meet is None else _stitch(parents[0], parents[1], meet)
+    stats.count(generated, sum(expanded), duplicates)
+    _record(stats, expanded, peak_frontier, parents, moves)
+    return moves
+
+
+if __name__ == "__main__":
+    initial_state = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+    for search in (bidirectional_bfs, bidirectional_a_star):
+        stats = SearchStats()
+        moves = search(initial_state, stats)
+        print(f"✅ {search.__name__}: {len(moves)} moves {''.join(moves)}")
+        print(f"   expanded {stats.details['forward_expanded']} forward + {stats.details['backward_expanded']} backward"
+              f" in {stats.timings_ns['search'] / 1e6:.1f} ms")
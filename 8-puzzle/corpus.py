@@ -0,0 +1,75 @@
+"""Reproducible 8-puzzle instance sets bucketed by optimal solution length.
+
+    python corpus.py --per-depth 10 --seed 0 --output corpus.jsonl
+
+Every solvable board is looked up in the distance table (see distance_table.py)
+and grouped by its exact distance; each bucket is then sampled with a seeded
+RNG. Boards are visited in lexicographic order, so a seed always gives the same
+set. Buckets smaller than --per-depth (31 moves has only two boards) are taken
+whole. Each output line is {"id": ..., "depth": ..., "board": [...]}.
+"""
+import argparse
+import json
+import random
+import sys
+from itertools import permutations
+
+from distance_table import distance
+from puzzle import EIGHT
+
+MAX_DEPTH = 31
+
+
+def boards_by_depth():
+    """Every solvable 8-puzzle board, as lists keyed by optimal solution length."""
+    buckets = {}
+    for board in permutations(range(EIGHT.size)):
+        depth = distance(list(board))
+        if depth is not None:
+            buckets.setdefault(depth, []).append(list(board))
+    return buckets
+
+
+def generate_corpus(per_depth=10, depths=range(1, MAX_DEPTH + 1), seed=0):
+    """Up to `per_depth` instance dicts for each depth, sampled reproducibly."""
+    rng = random.Random(seed)
+    buckets = boards_by_depth()
+    instances = []
+    for depth in depths:
+        bucket = buckets.get(depth, [])
+        for i, board in enumerate(rng.sample(bucket, min(per_depth, len(bucket)))):
+            instances.append({"id": f"d{depth:02}-{i}", "depth": depth, "board": board})
+    return instances
+
+
+def write_corpus(instances, out):
+    for instance in instances:
+        out.write(json.dumps(instance) + "\n")
+
+
+def read_corpus(stream):
+    """Instance dicts from a JSONL stream written by `write_corpus`."""
+    return [json.loads(line) for line in stream if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-depth", type=int, default=10, help="instances per depth bucket (default 10)")
+    parser.add_argument("--min-depth", type=int, default=1)
+    parser.add_argument("--max-depth", type=int, default=MAX_DEPTH)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSONL corpus file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    instances = generate_corpus(args.per_depth, range(args.min_depth, args.max_depth + 1), args.seed)
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        write_corpus(instances, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Exact solution length of every reachable 8-puzzle state.
+
+Only 9!/2 = 181,440 states are reachable from the goal, so one retrograde
+breadth-first search from the goal records all of their distances in a
+181,440-byte table. A state is indexed by its blank square and the order of
+the eight tiles read row by row, ranked without the last two tiles: on a
+solvable board that order is an even permutation, which fixes the last two,
+so the index is a perfect hash onto the reachable half.
+The table is written to `pdb/` once and memory-mapped afterwards.
+
+With the table, `solve` returns an optimal solution by greedy descent, one
+lookup per neighbour per move, and unsolvable boards are rejected by parity
+before any search.
+
+    python distance_table.py            # build if needed, print the depth histogram
+"""
+import mmap
+import os
+import struct
+import time
+from math import factorial
+
+from pattern_db import PDB_DIR, rank
+from puzzle import EIGHT
+
+PATH = os.path.join(PDB_DIR, "3x3-distances.bin")
+MAGIC = b"DST1"
+HEADER = struct.Struct("<4sB")  # magic, width
+ORDERS = factorial(EIGHT.size - 1) // 2  # even orders of the eight tiles
+STATES = EIGHT.size * ORDERS
+UNSEEN = 255
+
+_table = None
+
+
+def state_rank(state, puzzle=EIGHT):
+    """Index of a reachable packed state in the distance table."""
+    board = puzzle.unpack(state)
+    tiles = [tile - 1 for tile in board if tile]
+    return board.index(0) * ORDERS + rank(tiles[:-2], puzzle.size - 1)
+
+
+def build_distances(puzzle=EIGHT):
+    """Breadth-first search outward from the goal; returns the distance bytes."""
+    table = bytearray([UNSEEN]) * STATES
+    table[state_rank(puzzle.goal)] = 0
+    frontier = [(puzzle.goal, puzzle.goal_blank)]
+    depth = 0
+    while frontier:
+        depth += 1
+        layer = []
+        for state, blank in frontier:
+            for _, child, child_blank in puzzle.successors(state, blank):
+                index = state_rank(child)
+                if table[index] == UNSEEN:
+                    table[index] = depth
+                    layer.append((child, child_blank))
+        frontier = layer
+    return table
+
+
+def save_distances(table, path=PATH):
+    """Write the table atomically (temp file + rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, EIGHT.width))
+        f.write(table)
+    os.replace(tmp, path)
+
+
+def load_distances(path=PATH, build=True):
+    """Memory-map the distance table, building and saving it first if missing."""
+    if not os.path.exists(path):
+        if not build:
+            raise FileNotFoundError(f"no distance table at {path}")
+        start = time.perf_counter()
+        save_distances(build_distances(), path)
+        print(f"🧩 Built 8-puzzle distance table in {time.perf_counter() - start:.1f}s")
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, width = HEADER.unpack_from(mapped)
+    if magic != MAGIC or width != EIGHT.width or len(mapped) - HEADER.size != STATES:
+        raise ValueError(f"{path} is not an 8-puzzle distance table")
+    return memoryview(mapped)[HEADER.size:]
+
+
+def _distances():
+    global _table
+    if _table is None:
+        _table = load_distances()
+    return _table
+
+
+def distance(board):
+    """Optimal number of moves for a flat 8-puzzle board, or None if unsolvable."""
+    if not EIGHT.is_solvable(board):
+        return None
+    return _distances()[state_rank(EIGHT.pack(board))]
+
+
+def solve(board):
+    """Optimal blank moves for a flat 8-puzzle board, or None if unsolvable.
+
+    Every non-goal state has a neighbour one move closer, so stepping to any
+    such neighbour reaches the goal in exactly `distance(board)` moves.
+    """
+    if not EIGHT.is_solvable(board):
+        return None
+    table = _distances()
+    state, blank = EIGHT.pack(board), board.index(0)
+    remaining = table[state_rank(state)]
+    moves = []
+    while remaining:
+        for move, child, child_blank in EIGHT.successors(state, blank):
+            if table[state_rank(child)] == remaining - 1:
+                break
+        moves.append(move)
+        state, blank, remaining = child, child_blank, remaining - 1
+    return moves
+
+
+if __name__ == "__main__":
+    table = _distances()
+    counts = {}
+    for d in table:
+        counts[d] = counts.get(d, 0) + 1
+    for d in sorted(counts):
+        print(f"{d:3} moves: {counts[d]:6} states")
+
+    initial_state = [8, 6, 7, 2, 5, 4, 3, 0, 1]
+    start = time.perf_counter()
+    moves = solve(initial_state)
+    print(f"✅ {initial_state} solved in {len(moves)} moves ({time.perf_counter() - start:.6f}s): {''.join(moves)}")
+    unsolvable_state = [2, 1, 3, 4, 5, 6, 7, 8, 0]
+    if solve(unsolvable_state) is None:
+        print(f"❌ {unsolvable_state} is unsolvable")
@@ -0,0 +1,233 @@
+"""Disk-backed breadth-first search over a whole sliding-puzzle state space.
+
+Each BFS layer lives in its own file of sorted, distinct packed states
+(little-endian uint64, so the 8- and 15-puzzles fit). Layer d+1 is built by:
+
+1. expanding layer d, memory-mapped, a chunk at a time; each chunk's children
+   are sorted and de-duplicated in RAM and written out as a sorted run file;
+2. merging the runs with a k-way merge that holds one block per run (at most
+   FAN_IN at a time, in several passes when there are more). The last pass
+   also drops states already in layer d-1 (memory-mapped and searched by range).
+   The puzzle graph is bipartite (each move flips the blank's square colour),
+   so a child of layer d is either in layer d-1 or new: nothing else needs
+   subtracting.
+
+Every array held at once is sized from --memory-mb, so RAM stays bounded
+however large the layers grow; the layers themselves are only paged in through
+the memory maps. A JSON manifest records each completed layer and is replaced
+atomically after the layer file, so an interrupted run resumes after the last
+completed layer and discards any half-written runs.
+
+    python external_bfs.py --width 3 --dir bfs-3x3            # all 181,440 states
+    python external_bfs.py --width 4 --dir bfs-4x4 --max-depth 20 --memory-mb 256
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from puzzle import Puzzle
+
+DTYPE = np.dtype("<u8")
+MANIFEST = "manifest.json"
+# Bytes of working memory per parent in a chunk, measured: its (size, ) field
+# matrix while finding the blank, per-direction temporaries, up to four
+# children and np.unique's sorted copy of them
+BYTES_PER_PARENT = 512
+FAN_IN = 32  # runs merged at once; more are first merged in passes
+
+
+def layer_path(directory, depth):
+    return os.path.join(directory, f"layer-{depth:03}.bin")
+
+
+def open_layer(directory, depth):
+    """Memory-map a completed layer read-only (an empty array for an empty layer)."""
+    path = layer_path(directory, depth)
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r")
+
+
+def _write_array(path, values):
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(np.ascontiguousarray(values, dtype=DTYPE).tobytes())
+    os.replace(tmp, path)
+
+
+class _Expander:
+    """Vectorised successor generation for packed states of one puzzle."""
+
+    def __init__(self, puzzle):
+        if puzzle.size * puzzle.bits > 64:
+            raise ValueError(f"{puzzle.width}x{puzzle.width} states do not fit in 64 bits")
+        self.puzzle = puzzle
+        self.shifts = np.arange(puzzle.size, dtype=np.uint64) * np.uint64(puzzle.bits)
+        self.mask = np.uint64(puzzle.mask)
+        # targets[blank, d]: square the blank moves to in direction d, -1 if off the board
+        self.targets = np.full((puzzle.size, 4), -1, dtype=np.int64)
+        for blank, moves in enumerate(puzzle.moves):
+            for d, (_, target) in enumerate(moves):
+                self.targets[blank, d] = target
+
+    def children(self, states):
+        fields = (states[:, None] >> self.shifts) & self.mask
+        blanks = np.argmax(fields == 0, axis=1)
+        del fields
+        out = []
+        for d in range(4):
+            targets = self.targets[blanks, d]
+            legal = targets >= 0
+            parents, src, dst = states[legal], targets[legal].astype(np.uint64), blanks[legal].astype(np.uint64)
+            src_shift, dst_shift = src * np.uint64(self.puzzle.bits), dst * np.uint64(self.puzzle.bits)
+            tiles = (parents >> src_shift) & self.mask
+            out.append(parents ^ (tiles << src_shift) ^ (tiles << dst_shift))
+        return np.concatenate(out)
+
+
+def _write_runs(layer, expander, directory, chunk):
+    """Expand `layer` chunk by chunk into sorted, distinct run files; returns their paths."""
+    runs = []
+    for start in range(0, len(layer), chunk):
+        children = np.unique(expander.children(np.asarray(layer[start:start + chunk])))
+        path = os.path.join(directory, f"run-{len(runs):05}.bin")
+        _write_array(path, children)
+        runs.append(path)
+    return runs
+
+
+def _merge_runs(runs, previous, out, block):
+    """K-way merge of sorted runs into `out`, dropping duplicates and states in `previous`.
+
+    Each round takes the smallest of the runs' current block maxima as a cut:
+    every value up to the cut is then already in memory, so it can be merged and
+    written with no later value falling below it. Returns the states written.
+    """
+    sources = [np.memmap(path, dtype=DTYPE, mode="r") for path in runs if os.path.getsize(path)]
+    positions = [0] * len(sources)
+    written = 0
+    while True:
+        blocks = [(i, np.asarray(src[positions[i]:positions[i] + block]))
+                  for i, src in enumerate(sources) if positions[i] < len(src)]
+        if not blocks:
+            return written
+        cut = min(values[-1] for _, values in blocks)
+        parts = []
+        for i, values in blocks:
+            taken = int(np.searchsorted(values, cut, side="right"))
+            parts.append(values[:taken])
+            positions[i] += taken
+        merged = np.unique(np.concatenate(parts))
+        lo = int(np.searchsorted(previous, merged[0], side="left"))
+        hi = int(np.searchsorted(previous, merged[-1], side="right"))
+        if hi > lo:
+            merged = merged[~np.isin(merged, np.asarray(previous[lo:hi]), assume_unique=True)]
+        out.write(merged.tobytes())
+        written += len(merged)
+
+
+def _load_manifest(directory, puzzle):
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest["width"] != puzzle.width:
+        raise ValueError(f"{directory} holds a {manifest['width']}-wide search, not {puzzle.width}")
+    return manifest
+
+
+def _save_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def external_bfs(width, directory, memory_limit=64 << 20, max_depth=None, verbose=True):
+    """Breadth-first search from the goal with layers on disk; returns the manifest.
+
+    The manifest's "layers" list holds the number of states at each depth, and
+    "complete" is True once a layer came out empty (the last non-empty one is
+    the diameter). Stops early after `max_depth` layers; calling again with the
+    same directory resumes.
+    """
+    puzzle = Puzzle(width)
+    expander = _Expander(puzzle)
+    os.makedirs(directory, exist_ok=True)
+    chunk = max(1, memory_limit // BYTES_PER_PARENT)
+
+    manifest = _load_manifest(directory, puzzle)
+    if manifest is None:
+        _write_array(layer_path(directory, 0), np.array([puzzle.goal], dtype=DTYPE))
+        manifest = {"width": width, "layers": [1], "complete": False, "seconds": []}
+        _save_manifest(directory, manifest)
+    elif verbose:
+        print(f"↩️ Resuming after layer {len(manifest['layers']) - 1}")
+
+    while not manifest["complete"]:
+        depth = len(manifest["layers"])
+        if max_depth is not None and depth > max_depth:
+            break
+        start = time.perf_counter()
+        for stale in glob.glob(os.path.join(directory, "run-*.bin*")):
+            os.remove(stale)  # left over from an interrupted layer
+
+        runs = _write_runs(open_layer(directory, depth - 1), expander, directory, chunk)
+        written = len(runs)
+        block = max(1, memory_limit // (8 * 4 * (FAN_IN + 1)))
+        empty = np.zeros(0, dtype=DTYPE)
+        while len(runs) > FAN_IN:
+            merged = []
+            for i in range(0, len(runs), FAN_IN):
+                path = os.path.join(directory, f"run-{written:05}.bin")
+                with open(path, "wb") as out:
+                    _merge_runs(runs[i:i + FAN_IN], empty, out, block)
+                for run in runs[i:i + FAN_IN]:
+                    os.remove(run)
+                merged.append(path)
+                written += 1
+            runs = merged
+
+        previous = open_layer(directory, depth - 2) if depth >= 2 else empty
+        path = layer_path(directory, depth)
+        with open(f"{path}.tmp", "wb") as out:
+            count = _merge_runs(runs, previous, out, block)
+        os.replace(f"{path}.tmp", path)
+        for run in runs:
+            os.remove(run)
+
+        manifest["layers"].append(count)
+        manifest["seconds"].append(round(time.perf_counter() - start, 3))
+        manifest["complete"] = count == 0
+        _save_manifest(directory, manifest)
+        if verbose:
+            print(f"📀 depth {depth:3}: {count:14,} states ({written} runs, {manifest['seconds'][-1]:.2f}s)")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=3, choices=(2, 3, 4), help="puzzle width (default 3)")
+    parser.add_argument("--dir", required=True, help="directory for layer files and the manifest")
+    parser.add_argument("--memory-mb", type=float, default=64, help="working memory bound in MiB (default 64)")
+    parser.add_argument("--max-depth", type=int, help="stop after this layer (resume later with the same --dir)")
+    args = parser.parse_args(argv)
+
+    manifest = external_bfs(args.width, args.dir, int(args.memory_mb * (1 << 20)), args.max_depth)
+    layers = manifest["layers"]
+    if manifest["complete"]:
+        print(f"✅ {sum(layers):,} states reachable, diameter {len(layers) - 2}")
+    else:
+        print(f"⏸️ {sum(layers):,} states through depth {len(layers) - 1}; run again to continue")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""Hash-distributed A* (HDA*) for the sliding puzzles across worker processes.
+
+Every state has one owner, the worker picked by a multiplicative hash of its
+packed board, and only the owner keeps it in an open list and best-g table.
+A worker expands its own nodes with the same successor function and
+incremental heuristics as `a_star`, keeps children it owns, and buffers the
+rest per owner, sending them in batches through multiprocessing queues. Nodes
+carry their move string instead of a parent pointer, since parents live in
+other processes.
+
+A goal reached at cost c becomes the shared incumbent, and every worker drops
+nodes with f >= c. Termination: a worker is idle once its open list has no node
+below the incumbent and its buffers are flushed. The coordinator (the calling
+process) stops the search only when every worker is idle and the counts of
+batches sent and received are equal and unchanged across the check, i.e. no
+node is in flight. At that point no node with f below the incumbent is left
+anywhere, so with an admissible heuristic the incumbent is optimal.
+
+    python hda_star.py --workers 1 2 4 8 16 32 --heuristic manhattan
+"""
+import argparse
+import heapq
+import multiprocessing
+import sys
+from queue import Empty
+
+from heuristics import HEURISTICS, get_heuristic
+from puzzle import puzzle_for
+from search_stats import DISABLED, SearchStats
+
+NO_SOLUTION = 2 ** 31 - 1
+EXPANSIONS_PER_ROUND = 256  # expansions between inbox checks
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+# A 42-move 15-puzzle instance (linear-conflict A* expands about 100k nodes)
+DEFAULT_INSTANCE = [6, 15, 0, 4, 9, 7, 2, 1, 13, 10, 11, 3, 5, 14, 12, 8]
+
+
+def owner(state, workers):
+    """Worker that owns a packed state: Fibonacci hashing of the board's int hash.
+
+    hash() of an int is its value modulo a 61-bit prime, which folds in every
+    tile field and is the same in every process.
+    """
+    return (((hash(state) * HASH_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+
+class _Shared:
+    """Counters and flags the workers and coordinator share."""
+
+    def __init__(self, workers):
+        self.incumbent = multiprocessing.Value("i", NO_SOLUTION)
+        self.sent = multiprocessing.Value("q", 0)
+        self.received = multiprocessing.Value("q", 0)
+        self.idle = multiprocessing.Array("b", workers, lock=False)
+        self.stop = multiprocessing.Event()
+        self.inboxes = [multiprocessing.Queue() for _ in range(workers)]
+        self.results = multiprocessing.Queue()
+
+    def send(self, worker, batch):
+        with self.sent.get_lock():
+            self.sent.value += 1
+        self.inboxes[worker].put(batch)
+
+
+def _worker(index, workers, puzzle, heuristic, batch_size, shared):
+    h = get_heuristic(heuristic, puzzle)
+    open_list = []  # (f, -g, state, blank, moves)
+    best_g = {}
+    outboxes = [[] for _ in range(workers)]
+    expanded = generated = duplicates = peak_frontier = 0
+    incumbent = NO_SOLUTION
+
+    def accept(batch):
+        nonlocal duplicates
+        for f, g, state, blank, moves in batch:
+            if f >= incumbent or best_g.get(state, g + 1) <= g:
+                duplicates += 1
+                continue
+            best_g[state] = g
+            heapq.heappush(open_list, (f, -g, state, blank, moves))
+
+    def receive(batch):
+        shared.idle[index] = 0  # busy before the batch counts as received
+        with shared.received.get_lock():
+            shared.received.value += 1
+        accept(batch)
+
+    def flush(all_outboxes):
+        for worker, outbox in enumerate(outboxes):
+            if outbox and (all_outboxes or len(outbox) >= batch_size):
+                shared.send(worker, outbox)
+                outboxes[worker] = []
+
+    while not shared.stop.is_set():
+        while True:
+            try:
+                receive(shared.inboxes[index].get_nowait())
+            except Empty:
+                break
+        incumbent = shared.incumbent.value
+
+        if not open_list or open_list[0][0] >= incumbent:
+            flush(True)
+            shared.idle[index] = 1
+            try:
+                receive(shared.inboxes[index].get(timeout=0.005))
+            except Empty:
+                pass
+            continue
+
+        for _ in range(EXPANSIONS_PER_ROUND):
+            if not open_list or open_list[0][0] >= incumbent:
+                break
+            f, neg_g, state, blank, moves = heapq.heappop(open_list)
+            g = -neg_g
+            if best_g[state] < g:
+                duplicates += 1
+                continue  # superseded by a cheaper path to the same board
+            expanded += 1
+            h_value = f - g
+            child_g = g + 1
+            for move, child, child_blank in puzzle.successors(state, blank):
+                tile = puzzle.tile_at(state, child_blank)
+                child_f = child_g + h.update(state, child, h_value, tile, child_blank, blank)
+                if child_f >= incumbent:
+                    continue
+                generated += 1
+                if child == puzzle.goal:
+                    with shared.incumbent.get_lock():
+                        if child_g < shared.incumbent.value:
+                            shared.incumbent.value = child_g
+                            shared.results.put(("solution", child_g, moves + move))
+                    incumbent = shared.incumbent.value
+                    continue
+                node = (child_f, child_g, child, child_blank, moves + move)
+                target = owner(child, workers)
+                if target == index:
+                    accept((node,))
+                else:
+                    outboxes[target].append(node)
+        if len(open_list) > peak_frontier:
+            peak_frontier = len(open_list)
+        flush(False)
+
+    shared.results.put(("stats", index, expanded, generated, duplicates, peak_frontier, len(best_g)))
+
+
+def _quiescent(shared, workers):
+    """True when every worker is idle and no batch is in flight, stable across the check."""
+    sent, received = shared.sent.value, shared.received.value
+    if sent != received or not all(shared.idle[i] for i in range(workers)):
+        return False
+    return shared.sent.value == sent and shared.received.value == received
+
+
+def hda_star(start_state, workers=4, heuristic="manhattan", batch_size=64, stats=None):
+    """Optimal blank moves for a flat board using `workers` processes, or None if unsolvable.
+
+    `stats` (a SearchStats) gets the summed node counts and each worker's
+    expansions in details["expanded_per_worker"].
+    """
+    stats = DISABLED if stats is None else stats
+    puzzle = puzzle_for(start_state)
+    if not puzzle.is_solvable(start_state):
+        return None
+    start = puzzle.pack(start_state)
+    if start == puzzle.goal:
+        stats.solution(0)
+        return []
+
+    shared = _Shared(workers)
+    processes = [multiprocessing.Process(target=_worker, args=(i, workers, puzzle, heuristic, batch_size, shared),
+                                         daemon=True) for i in range(workers)]
+    h_start = get_heuristic(heuristic, puzzle).initial(start)
+    best = None
+    per_worker = [0] * workers
+    with stats.phase("search"):
+        for process in processes:
+            process.start()
+        shared.send(owner(start, workers), [(h_start, 0, start, start_state.index(0), "")])
+
+        reports = 0
+        while reports < workers:
+            try:
+                message = shared.results.get(timeout=0.002)
+            except Empty:
+                if not shared.stop.is_set() and _quiescent(shared, workers):
+                    shared.stop.set()
+                continue
+            if message[0] == "solution":
+                if best is None or message[1] < best[0]:
+                    best = message[1:]
+            else:
+                _, index, expanded, generated, duplicates, peak_frontier, closed = message
+                per_worker[index] = expanded
+                stats.count(generated, expanded, duplicates)
+                stats.observe(peak_frontier, closed)
+                reports += 1
+        for process in processes:
+            process.join()
+
+    stats.detail(expanded_per_worker=per_worker)
+    if best is None:
+        return None
+    stats.solution(best[0])
+    return list(best[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="manhattan")
+    parser.add_argument("--batch-size", type=int, default=64, help="children per message (default 64)")
+    parser.add_argument("--board", nargs="+", type=int, default=DEFAULT_INSTANCE, help="flat start board")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    for workers in args.workers:
+        stats = SearchStats()
+        moves = hda_star(args.board, workers, args.heuristic, args.batch_size, stats)
+        seconds = stats.timings_ns["search"] / 1e9
+        baseline = baseline or seconds
+        print(f"✅ {workers:2} workers: {len(moves)} moves, {stats.expanded:9} expanded, "
+              f"{seconds:7.2f}s, speedup {baseline / seconds:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+from bisect import bisect_left
+
+from pattern_db import PatternDatabase
+
+
+class Misplaced:
+    """Number of tiles out of place."""
+
+    name = "misplaced"
+
+    def __init__(self, puzzle):
+        self.puzzle = puzzle
+
+    def initial(self, state):
+        return self.puzzle.misplaced(state, self.puzzle.find_blank(state))
+
+    def update(self, parent, child, h, tile, src, dst):
+        """h of `child`, where `tile` slid from `src` to `dst` in `parent`."""
+        goal = tile - 1
+        return h + (src == goal) - (dst == goal)
+
+
+class Manhattan:
+    """Sum of tile distances to their goal squares, from a per-tile table.
+
+    `target` is a flat board to measure towards instead of the goal, as the
+    backward half of a bidirectional search needs.
+    """
+
+    name = "manhattan"
+
+    def __init__(self, puzzle, target=None):
+        self.puzzle = puzzle
+        width = puzzle.width
+        target = target or puzzle.goal_board
+        # distance[tile][pos]; the blank (tile 0) contributes nothing
+        self.distance = [[0] * puzzle.size]
+        for tile in range(1, puzzle.size):
+            goal_row, goal_col = divmod(target.index(tile), width)
+            self.distance.append([abs(pos // width - goal_row) + abs(pos % width - goal_col)
+                                  for pos in range(puzzle.size)])
+
+    def initial(self, state):
+        puzzle = self.puzzle
+        return sum(self.distance[puzzle.tile_at(state, pos)][pos] for pos in range(puzzle.size))
+
+    def update(self, parent, child, h, tile, src, dst):
+        distance = self.distance[tile]
+        return h + distance[dst] - distance[src]
+
+
+def _min_removals(goals):
+    """Tiles to take out of a line so the rest are in goal order (len - longest increasing run)."""
+    tails = []
+    for goal in goals:
+        i = bisect_left(tails, goal)
+        if i == len(tails):
+            tails.append(goal)
+        else:
+            tails[i] = goal
+    return len(goals) - len(tails)
+
+
+class LinearConflict(Manhattan):
+    """Manhattan distance plus two moves per tile that must leave its line to let others pass.
+
+    Two tiles in their goal row (or column) but in reverse order cannot pass each
+    other without one of them stepping out, which costs two extra moves. Each
+    line's conflict count depends only on the tiles in it, so it is cached by
+    the line's packed contents and a single slide only re-reads two lines.
+    """
+
+    name = "linear_conflict"
+
+    def __init__(self, puzzle):
+        super().__init__(puzzle)
+        width, bits = puzzle.width, puzzle.bits
+        self.row_mask = (1 << (width * bits)) - 1
+        self.row_cache = [{} for _ in range(width)]
+        self.col_cache = [{} for _ in range(width)]
+
+    def _row(self, state, row):
+        puzzle = self.puzzle
+        key = (state >> (row * puzzle.width * puzzle.bits)) & self.row_mask
+        cache = self.row_cache[row]
+        if key not in cache:
+            goals = []
+            for col in range(puzzle.width):
+                tile = (key >> (col * puzzle.bits)) & puzzle.mask
+                if tile and (tile - 1) // puzzle.width == row:
+                    goals.append((tile - 1) % puzzle.width)
+            cache[key] = _min_removals(goals)
+        return cache[key]
+
+    def _col(self, state, col):
+        puzzle = self.puzzle
+        tiles = tuple(puzzle.tile_at(state, row * puzzle.width + col) for row in range(puzzle.width))
+        cache = self.col_cache[col]
+        if tiles not in cache:
+            goals = [(tile - 1) // puzzle.width for tile in tiles if tile and (tile - 1) % puzzle.width == col]
+            cache[tiles] = _min_removals(goals)
+        return cache[tiles]
+
+    def initial(self, state):
+        width = self.puzzle.width
+        conflicts = sum(self._row(state, i) + self._col(state, i) for i in range(width))
+        return super().initial(state) + 2 * conflicts
+
+    def update(self, parent, child, h, tile, src, dst):
+        h = super().update(parent, child, h, tile, src, dst)
+        width = self.puzzle.width
+        if src // width == dst // width:  # horizontal slide: only the two columns change
+            a, b = src % width, dst % width
+            return h + 2 * (self._col(child, a) + self._col(child, b) - self._col(parent, a) - self._col(parent, b))
+        a, b = src // width, dst // width  # vertical slide: only the two rows change
+        return h + 2 * (self._row(child, a) + self._row(child, b) - self._row(parent, a) - self._row(parent, b))
+
+
+HEURISTICS = {cls.name: cls for cls in (Misplaced, Manhattan, LinearConflict, PatternDatabase)}
+
+_instances = {}
+
+
+def get_heuristic(name, puzzle):
+    """Shared heuristic instance for a puzzle, so lookup tables and caches are built once."""
+    key = (name, puzzle.size)
+    if key not in _instances:
+        _instances[key] = HEURISTICS[name](puzzle)
+    return _instances[key]
+
+
+# Standard 8-puzzle instances with their optimal solution lengths, from 4 to 31 moves
+STANDARD_INSTANCES = [
+    ([1, 2, 3, 7, 4, 5, 0, 8, 6], 4),
+    ([2, 4, 3, 1, 8, 5, 0, 7, 6], 8),
+    ([1, 2, 3, 8, 7, 4, 6, 5, 0], 12),
+    ([2, 5, 0, 3, 4, 1, 7, 8, 6], 16),
+    ([2, 8, 0, 7, 6, 3, 1, 5, 4], 18),
+    ([5, 2, 3, 4, 8, 7, 1, 6, 0], 20),
+    ([8, 7, 5, 1, 2, 6, 4, 3, 0], 22),
+    ([7, 5, 6, 2, 0, 8, 4, 1, 3], 24),
+    ([2, 1, 7, 8, 4, 6, 0, 3, 5], 26),
+    ([6, 8, 7, 5, 4, 1, 3, 2, 0], 28),
+    ([0, 8, 7, 6, 4, 5, 1, 2, 3], 30),
+    ([8, 6, 7, 2, 5, 4, 3, 0, 1], 31),
+]
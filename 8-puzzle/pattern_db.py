@@ -0,0 +1,213 @@
+"""Disjoint additive pattern databases for the sliding puzzles.
+
+Each pattern is a subset of tiles. Its table holds, for every placement of
+those tiles, the fewest moves *of pattern tiles* needed to bring them home,
+found by a backward breadth-first search from the goal. The other tiles are
+erased from the board, so a pattern tile may slide into any square not taken
+by another pattern tile. No move is counted by two patterns, so the tables of
+a partition add up to an admissible (and consistent) heuristic.
+
+Tables are byte arrays indexed by the rank of the pattern tiles' positions as
+a k-permutation of the board, so a 6-tile pattern of the 15-puzzle takes
+16!/10! = 5,765,760 bytes. They are written once to `pdb/` and memory-mapped
+at solve time: opening is instant and solver processes share the pages.
+
+    python pattern_db.py 4            # build the default 15-puzzle tables
+    python pattern_db.py 4 --partition 5-5-5
+"""
+import argparse
+import mmap
+import os
+import struct
+import time
+from math import perm
+
+import numpy as np
+
+from puzzle import EIGHT, FIFTEEN, TWENTY_FOUR, Puzzle
+
+PDB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdb")
+MAGIC = b"PDB1"
+# magic, width, number of pattern tiles; the tiles follow as one byte each
+HEADER = struct.Struct("<4sBB")
+UNSEEN = 255
+CHUNK = 1 << 18  # frontier states expanded per numpy batch
+
+# Default partitions: 4-4 for the 8-puzzle, 6-6-3 for the 15-puzzle and six
+# 4-tile patterns for the 24-puzzle (larger 24-puzzle patterns are too big to build here)
+PARTITIONS = {
+    EIGHT.width: ((1, 2, 4, 5), (3, 6, 7, 8)),
+    FIFTEEN.width: ((1, 5, 6, 9, 10, 13), (7, 8, 11, 12, 14, 15), (2, 3, 4)),
+    TWENTY_FOUR.width: ((1, 2, 6, 7), (3, 4, 8, 9), (5, 10, 15, 20),
+                        (11, 12, 16, 17), (13, 14, 18, 19), (21, 22, 23, 24)),
+}
+
+# Other named partitions, selectable with --partition
+NAMED_PARTITIONS = {
+    (FIFTEEN.width, "5-5-5"): ((1, 2, 5, 6, 9), (3, 4, 7, 8, 11), (10, 12, 13, 14, 15)),
+    (FIFTEEN.width, "6-6-3"): PARTITIONS[FIFTEEN.width],
+    (EIGHT.width, "4-4"): PARTITIONS[EIGHT.width],
+}
+
+
+def rank(positions, size):
+    """Rank of distinct board positions as a k-permutation of range(size)."""
+    result = used = 0
+    for i, pos in enumerate(positions):
+        result = result * (size - i) + pos - (used & ((1 << pos) - 1)).bit_count()
+        used |= 1 << pos
+    return result
+
+
+def _rank_rows(positions, size):
+    """`rank` for every row of an (M, k) array of positions."""
+    k = positions.shape[1]
+    weights = [perm(size - i - 1, k - i - 1) for i in range(k)]
+    ranks = np.zeros(len(positions), dtype=np.int64)
+    for i in range(k):
+        digit = positions[:, i].astype(np.int64)
+        for j in range(i):
+            digit -= positions[:, j] < positions[:, i]
+        ranks += digit * weights[i]
+    return ranks
+
+
+def build_table(puzzle, tiles):
+    """Backward BFS over the placements of `tiles`; returns the byte table."""
+    size, k = puzzle.size, len(tiles)
+    neighbours = np.full((size, 4), -1, dtype=np.int8)
+    for pos, moves in enumerate(puzzle.moves):
+        for d, (_, target) in enumerate(moves):
+            neighbours[pos, d] = target
+
+    table = np.full(perm(size, k), UNSEEN, dtype=np.uint8)
+    frontier = np.array([[tile - 1 for tile in tiles]], dtype=np.int8)
+    table[_rank_rows(frontier, size)] = 0
+    depth = 0
+    while len(frontier):
+        depth += 1
+        layer = []
+        for start in range(0, len(frontier), CHUNK):
+            block = frontier[start:start + CHUNK]
+            for i in range(k):
+                for d in range(4):
+                    target = neighbours[block[:, i], d]
+                    free = (target >= 0) & ~(block == target[:, None]).any(axis=1)
+                    children = block[free]
+                    children[:, i] = target[free]
+                    ranks = _rank_rows(children, size)
+                    new = table[ranks] == UNSEEN
+                    ranks, first = np.unique(ranks[new], return_index=True)
+                    table[ranks] = depth
+                    layer.append(children[new][first])
+        frontier = np.concatenate(layer)
+    return table
+
+
+def table_path(puzzle, tiles, directory=PDB_DIR):
+    return os.path.join(directory, f"{puzzle.width}x{puzzle.width}-{'-'.join(map(str, tiles))}.pdb")
+
+
+def save_table(path, puzzle, tiles, table):
+    """Write a table atomically (temp file + rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, puzzle.width, len(tiles)))
+        f.write(bytes(tiles))
+        f.write(table.tobytes())
+    os.replace(tmp, path)
+
+
+def open_table(puzzle, tiles, directory=PDB_DIR, build=True):
+    """Memory-map the table for `tiles`, building it first if it is missing."""
+    path = table_path(puzzle, tiles, directory)
+    if not os.path.exists(path):
+        if not build:
+            raise FileNotFoundError(f"no pattern database at {path}")
+        start = time.perf_counter()
+        save_table(path, puzzle, tiles, build_table(puzzle, tiles))
+        print(f"🧩 Built pattern database {os.path.basename(path)} in {time.perf_counter() - start:.1f}s")
+
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, width, k = HEADER.unpack_from(mapped)
+    offset = HEADER.size + k
+    if magic != MAGIC or width != puzzle.width or tuple(mapped[HEADER.size:offset]) != tuple(tiles):
+        raise ValueError(f"{path} is not a pattern database for tiles {tiles}")
+    if len(mapped) - offset != perm(puzzle.size, k):
+        raise ValueError(f"{path} is truncated")
+    return memoryview(mapped)[offset:]
+
+
+class PatternDatabase:
+    """Sum of disjoint pattern database lookups, as a heuristic for `a_star`.
+
+    A slide changes the placement of one pattern only, so `update` re-ranks
+    that pattern for the parent and the child and adjusts h by the difference.
+    """
+
+    name = "pdb"
+
+    def __init__(self, puzzle, partition=None, directory=PDB_DIR):
+        self.puzzle = puzzle
+        self.partition = partition or PARTITIONS[puzzle.width]
+        # pattern_of[tile] is its pattern's index (-1 if in none), slot[tile] its place in that pattern
+        self.pattern_of = [-1] * puzzle.size
+        self.slot = [0] * puzzle.size
+        for p, tiles in enumerate(self.partition):
+            for s, tile in enumerate(tiles):
+                if self.pattern_of[tile] != -1:
+                    raise ValueError(f"tile {tile} is in more than one pattern")
+                self.pattern_of[tile], self.slot[tile] = p, s
+        self.tables = [open_table(puzzle, tiles, directory) for tiles in self.partition]
+
+    def _positions(self, state):
+        puzzle = self.puzzle
+        positions = [[0] * len(tiles) for tiles in self.partition]
+        for pos in range(puzzle.size):
+            tile = (state >> (pos * puzzle.bits)) & puzzle.mask
+            if self.pattern_of[tile] >= 0:
+                positions[self.pattern_of[tile]][self.slot[tile]] = pos
+        return positions
+
+    def initial(self, state):
+        size = self.puzzle.size
+        return sum(table[rank(positions, size)] for table, positions in zip(self.tables, self._positions(state)))
+
+    def update(self, parent, child, h, tile, src, dst):
+        pattern = self.pattern_of[tile]
+        if pattern < 0:
+            return h
+        puzzle = self.puzzle
+        positions = [0] * len(self.partition[pattern])
+        for pos in range(puzzle.size):
+            other = (child >> (pos * puzzle.bits)) & puzzle.mask
+            if self.pattern_of[other] == pattern:
+                positions[self.slot[other]] = pos
+        table = self.tables[pattern]
+        child_h = table[rank(positions, puzzle.size)]
+        positions[self.slot[tile]] = src
+        return h + child_h - table[rank(positions, puzzle.size)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("width", type=int, choices=sorted(PARTITIONS), help="puzzle width (3, 4 or 5)")
+    parser.add_argument("--partition", help="named partition such as 5-5-5 (default: the width's standard one)")
+    parser.add_argument("--dir", default=PDB_DIR, help=f"table directory (default: {PDB_DIR})")
+    args = parser.parse_args(argv)
+
+    if args.partition and (args.width, args.partition) not in NAMED_PARTITIONS:
+        parser.error(f"no partition {args.partition!r} for width {args.width}")
+    puzzle = Puzzle(args.width)
+    partition = NAMED_PARTITIONS[args.width, args.partition] if args.partition else PARTITIONS[args.width]
+    for tiles in partition:
+        table = open_table(puzzle, tiles, args.dir)
+        values = np.frombuffer(table, dtype=np.uint8)
+        print(f"✅ {tiles}: {len(values):,} entries, max {values.max()}, mean {values.mean():.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+from math import isqrt
+
+# The blank move that undoes each move
+REVERSE = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+
+class Puzzle:
+    """Geometry and packed-integer state encoding for a width×width sliding puzzle.
+
+    A state is one int holding the tile at position i in bits
+    [i*bits, (i+1)*bits). Tiles take 4 bits up to the 15-puzzle and 5 bits for
+    the 24-puzzle, whose tile numbers no longer fit in a nibble. The blank is 0.
+    """
+
+    def __init__(self, width):
+        self.width = width
+        self.size = width * width
+        self.bits = max(4, (self.size - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.goal_board = list(range(1, self.size)) + [0]
+        self.goal = self.pack(self.goal_board)
+        self.goal_blank = self.size - 1
+
+        # moves[blank] lists (move, target): sliding the blank onto `target`
+        steps = {"U": -width, "D": width, "L": -1, "R": 1}
+        self.moves = []
+        for blank in range(self.size):
+            row, col = divmod(blank, width)
+            legal = {"U": row > 0, "D": row < width - 1, "L": col > 0, "R": col < width - 1}
+            self.moves.append(tuple((move, blank + step) for move, step in steps.items() if legal[move]))
+
+        # Masks for counting non-zero tile fields in one pass (see `misplaced`)
+        self._low_bits = sum(1 << (i * self.bits) for i in range(self.size))
+
+    def pack(self, board):
+        state = 0
+        for i, tile in enumerate(board):
+            state |= tile << (i * self.bits)
+        return state
+
+    def unpack(self, state):
+        return [(state >> (i * self.bits)) & self.mask for i in range(self.size)]
+
+    def tile_at(self, state, pos):
+        return (state >> (pos * self.bits)) & self.mask
+
+    def find_blank(self, state):
+        for pos in range(self.size):
+            if not (state >> (pos * self.bits)) & self.mask:
+                return pos
+        raise ValueError("state has no blank")
+
+    def slide(self, state, blank, target):
+        """Move the tile at `target` into the blank at `blank`."""
+        shift = target * self.bits
+        tile = (state >> shift) & self.mask
+        return state ^ (tile << shift) ^ (tile << (blank * self.bits))
+
+    def successors(self, state, blank):
+        """Yield (move, child, child_blank) for every legal blank move."""
+        for move, target in self.moves[blank]:
+            yield move, self.slide(state, blank, target), target
+
+    def misplaced(self, state, blank):
+        """Number of tiles (not the blank) out of their goal position."""
+        diff = state ^ self.goal
+        # OR each tile field onto its lowest bit, then count fields that differ
+        folded = diff
+        for shift in range(1, self.bits):
+            folded |= diff >> shift
+        count = (folded & self._low_bits).bit_count()
+        return count - (blank != self.goal_blank)
+
+    def is_solvable(self, board):
+        """Whether a flat board can reach the goal, by permutation parity.
+
+        A slide along a row keeps the number of tile inversions; a slide along
+        a column changes it by width - 1. On odd widths the inversion count
+        must be even. On even widths each column slide also moves the blank
+        one row, so inversions + blank row keeps the goal's parity (width - 1).
+        """
+        tiles = [tile for tile in board if tile]
+        inversions = sum(a > b for i, a in enumerate(tiles) for b in tiles[i + 1:])
+        if self.width % 2:
+            return inversions % 2 == 0
+        return (inversions + board.index(0) // self.width) % 2 == (self.width - 1) % 2
+
+    def reachable(self, board, target):
+        """Whether flat board `target` can be reached from `board` (same tiles, blank 0).
+
+        Every move swaps the blank with a neighbour: one transposition, and one
+        step of the blank's taxicab distance. So the permutation taking board to
+        target must have the parity of that distance.
+        """
+        where = {tile: i for i, tile in enumerate(target)}
+        perm = [where[tile] for tile in board]
+        swaps = 0
+        for i in range(len(perm)):
+            while perm[i] != i:
+                j = perm[i]
+                perm[i], perm[j] = perm[j], j
+                swaps += 1
+        row, col = divmod(board.index(0), self.width)
+        goal_row, goal_col = divmod(target.index(0), self.width)
+        return swaps % 2 == (abs(row - goal_row) + abs(col - goal_col)) % 2
+
+
+EIGHT = Puzzle(3)
+FIFTEEN = Puzzle(4)
+TWENTY_FOUR = Puzzle(5)
+
+_PUZZLES = {p.size: p for p in (EIGHT, FIFTEEN, TWENTY_FOUR)}
+
+
+def relabel(board, target, blank=0):
+    """Flat `board` and `target` renumbered so `blank` becomes 0 and the other
+    tiles 1, 2, ... in the order they appear in `target`, ready to pack."""
+    if sorted(board) != sorted(target) or blank not in target:
+        raise ValueError("board and target must hold the same tiles, including the blank")
+    labels = {tile: i + 1 for i, tile in enumerate(tile for tile in target if tile != blank)}
+    labels[blank] = 0
+    return [labels[tile] for tile in board], [labels[tile] for tile in target]
+
+
+def puzzle_for(board):
+    """The Puzzle matching a flat board's length (9, 16, 25, or any square)."""
+    size = len(board)
+    if size not in _PUZZLES:
+        width = isqrt(size)
+        if width * width != size:
+            raise ValueError(f"board of {size} tiles is not square")
+        _PUZZLES[size] = Puzzle(width)
+    return _PUZZLES[size]
@@ -0,0 +1,152 @@
+"""Counters and timings shared by the sliding-puzzle searches.
+
+A solver takes an optional `stats=SearchStats()` and fills it in. Solvers count
+in local variables and hand the totals over once per search or per deepening
+iteration, so the hot loops do no extra work; with `SearchStats(enabled=False)`
+(or no stats at all) even those hand-overs return immediately.
+
+    stats = SearchStats()
+    a_star(board, "manhattan", stats)
+    print(stats.expanded, stats.branching_factor())
+    stats.to_json("a_star.json")
+"""
+import json
+import time
+
+
+class _Phase:
+    """Adds the nanoseconds spent inside a `with` block to one named timing."""
+
+    __slots__ = ("stats", "name", "start")
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        timings = self.stats.timings_ns
+        timings[self.name] = timings.get(self.name, 0) + time.perf_counter_ns() - self.start
+        return False
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class SearchStats:
+    """What a search did: node counts, peak memory structures, iterations and timings.
+
+    generated   children created
+    expanded    nodes whose children were generated
+    duplicates  children or queue entries dropped because the state was already
+                reached as cheaply (or, for pruned moves, trivially)
+    peak_frontier / peak_closed
+                largest open list (or stack) and visited set seen
+    depth       solution length, once found
+    iterations  one dict per deepening iteration: limit, generated, expanded, ns
+    timings_ns  nanoseconds per named phase (see `phase`)
+    details     solver-specific counts, such as nodes expanded per side
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.generated = 0
+        self.expanded = 0
+        self.duplicates = 0
+        self.peak_frontier = 0
+        self.peak_closed = 0
+        self.depth = None
+        self.iterations = []
+        self.timings_ns = {}
+        self.details = {}
+
+    def count(self, generated=0, expanded=0, duplicates=0):
+        if self.enabled:
+            self.generated += generated
+            self.expanded += expanded
+            self.duplicates += duplicates
+
+    def observe(self, frontier=0, closed=0):
+        """Record frontier and closed-set sizes, keeping the peaks."""
+        if self.enabled:
+            if frontier > self.peak_frontier:
+                self.peak_frontier = frontier
+            if closed > self.peak_closed:
+                self.peak_closed = closed
+
+    def iteration(self, limit, generated, expanded=0, ns=0):
+        """Record one iterative-deepening pass and add its counts to the totals."""
+        if self.enabled:
+            self.iterations.append({"limit": limit, "generated": generated, "expanded": expanded, "ns": ns})
+            self.generated += generated
+            self.expanded += expanded
+
+    def detail(self, **counts):
+        if self.enabled:
+            self.details.update(counts)
+
+    def solution(self, depth):
+        if self.enabled:
+            self.depth = depth
+
+    def phase(self, name):
+        """Context manager timing a named phase with perf_counter_ns."""
+        return _Phase(self, name) if self.enabled else _NO_PHASE
+
+    def branching_factor(self, tolerance=1e-9):
+        """Effective branching factor b*: a uniform tree of the solution depth with
+        b* children per node would hold generated + 1 nodes. None before a solution."""
+        if not self.depth or not self.generated:
+            return None
+        target = self.generated + 1
+
+        def tree_size(b):
+            return sum(b ** i for i in range(self.depth + 1))
+
+        low, high = 0.0, target ** (1 / self.depth) + 1  # b*^depth <= target
+        while high - low > tolerance * high:
+            mid = (low + high) / 2
+            if tree_size(mid) < target:
+                low = mid
+            else:
+                high = mid
+        return (low + high) / 2
+
+    def as_dict(self):
+        return {
+            "generated": self.generated,
+            "expanded": self.expanded,
+            "duplicates": self.duplicates,
+            "peak_frontier": self.peak_frontier,
+            "peak_closed": self.peak_closed,
+            "depth": self.depth,
+            "branching_factor": self.branching_factor(),
+            "iterations": self.iterations,
+            "timings_ns": self.timings_ns,
+            "details": self.details,
+        }
+
+    def to_json(self, path=None):
+        """The stats as a JSON string, also written to `path` if given."""
+        text = json.dumps(self.as_dict(), indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+
+# Shared do-nothing instance for solvers called without stats
+DISABLED = SearchStats(enabled=False)
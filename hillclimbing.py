@@ -1,15 +1,14 @@
 
+import os
 import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "n-queens"))
+from conflict_tracker import ConflictTracker
 
 # Heuristic: number of pairs of queens attacking each other
 def calculate_cost(state):
-    cost = 0
-    n = len(state)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if state[i] == state[j] or abs(state[i] - state[j]) == abs(i - j):
-                cost += 1
-    return cost
+    return ConflictTracker(state).cost
 
 
 # Generate all neighbors of the current state
@@ -26,32 +25,37 @@ def get_neighbors(state):
 
 
 # Hill climbing algorithm
-def hill_climb(initial_state):
-    current = initial_state
-    current_cost = calculate_cost(current)
+# With verbose=False nothing is printed; a `stats` dict gets steps and cost evaluations.
+def hill_climb(initial_state, vectorized=False, verbose=True, stats=None):
+    tracker = ConflictTracker(initial_state)
+    current = list(initial_state)
+    current_cost = tracker.cost
+    n = len(current)
+    steps = 0
 
-    print(f"Initial state: {current}, Cost = {current_cost}")
+    if verbose:
+        print(f"Initial state: {current}, Cost = {current_cost}")
 
     while True:
-        neighbors = get_neighbors(current)
-        best_neighbor = None
-        best_cost = current_cost
-
-        # Find the best neighbor
-        for neighbor in neighbors:
-            cost = calculate_cost(neighbor)
-            if cost < best_cost:
-                best_cost = cost
-                best_neighbor = neighbor
+        # Find the best neighbor (scored incrementally by the tracker)
+        best = tracker.best_move(vectorized)
 
         # If no better neighbor is found → stop
-        if best_neighbor is None:
-            print(f"Final state: {current}, Cost = {current_cost}")
+        if best is None:
+            if verbose:
+                print(f"Final state: {current}, Cost = {current_cost}")
+            if stats is not None:
+                stats["steps"] = steps
+                stats["evaluations"] = (steps + 1) * n * (n - 1)
             return current, current_cost
 
         # Move to the better neighbor
-        current, current_cost = best_neighbor, best_cost
-        print(f"Move to: {current}, Cost = {current_cost}")
+        col, row, _ = best
+        current_cost = tracker.move(col, row)
+        current = tracker.board.tolist()
+        steps += 1
+        if verbose:
+            print(f"Move to: {current}, Cost = {current_cost}")
 
 
 # Example usage
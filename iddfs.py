@@ -1,244 +1,160 @@
+import os
+import sys
+import time
+from collections import deque
 
-import copy
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "8-puzzle"))
+from bidirectional import bidirectional_bfs
+from puzzle import puzzle_for, relabel
+from search_stats import DISABLED, SearchStats
 
 inp=[[1,2,3],[4,-1,5],[6,7,8]]
 
 out=[[1,2,3],[6,4,5],[-1,7,8]]
 
-def move(temp, movement):
-
-if movement=="up":
-
-for i in range(3):
-
-for j in range(3):
-
-if(temp[i][j]==-1):
-
-if i!=0:
-
-temp[i][j]=temp[i-1][j]
-
-temp[i-1][j]=-1
-
-return temp
-
-if movement=="down":
-
-for i in range(3):
-
-for j in range(3):
-
-if(temp[i][j]==-1):
-
-if i!=2:
-
-temp[i][j]=temp[i+1][j]
-
-temp[i+1][j]=-1
-
-return temp
-
-if movement=="left":
-
-for i in range(3):
-
-for j in range(3):
-
-if(temp[i][j]==-1):
-
-if j!=0:
-
-temp[i][j]=temp[i][j-1]
-
-temp[i][j-1]=-1
-
-return temp
-
-if movement=="right":
-
-for i in range(3):
-
-for j in range(3):
-
-if(temp[i][j]==-1):
-
-if j!=2:
-
-temp[i][j]=temp[i][j+1]
-
-temp[i][j+1]=-1
-
-return temp
-
-def ids():
-
-global inp
-global out
-
-global flag
-
-for limit in range(100):
-
-print('LIMIT -> '+str(limit))
-
-stack=[]
-
-inpx=[inp,"none"]
-
-stack.append(inpx)
-
-level=0
-
-while(True):
-
-if len(stack)==0:
-
-break
-
-puzzle=stack.pop(0)
-
-if level<=limit:
-
-print(str(puzzle[1])+" --> "+str(puzzle[0]))
-
-if(puzzle[0]==out):
-
-print("Found")
-
-print('Path cost='+str(level))
-
-flag=True
-
-return
-
-else:
-
-level=level+1
-
-if(puzzle[1]!="down"):
-
-temp=copy.deepcopy(puzzle[0])
-
-up=move(temp, "up")
-
-if(up!=puzzle[0]):
-
-upx=[up,"up"]
-
-stack.insert(0, upx)
-
-if(puzzle[1]!="right"):
-
-temp=copy.deepcopy(puzzle[0])
-
-left=move(temp, "left")
-
-if(left!=puzzle[0]):
-
-leftx=[left,"left"]
-
-stack.insert(0, leftx)
-
-if(puzzle[1]!="up"):
-
-temp=copy.deepcopy(puzzle[0])
-
-down=move(temp, "down")
-
-if(down!=puzzle[0]):
-
-downx=[down,"down"]
-
-stack.insert(0, downx)global out
-
-global flag
-
-for limit in range(100):
-
-print('LIMIT -> '+str(limit))
-
-stack=[]
-
-inpx=[inp,"none"]
-
-stack.append(inpx)
-
-level=0
-
-while(True):
-
-if len(stack)==0:
-
-break
-
-puzzle=stack.pop(0)
-
-if level<=limit:
-
-print(str(puzzle[1])+" --> "+str(puzzle[0]))
-
-if(puzzle[0]==out):
-
-print("Found")
-
-print('Path cost='+str(level))
-
-flag=True
-
-return
-
-else:
-
-level=level+1
-
-if(puzzle[1]!="down"):
-
-temp=copy.deepcopy(puzzle[0])
-
-up=move(temp, "up")
-
-if(up!=puzzle[0]):
-
-upx=[up,"up"]
-
-stack.insert(0, upx)
-
-if(puzzle[1]!="right"):
-
-temp=copy.deepcopy(puzzle[0])
-
-left=move(temp, "left")
-
-if(left!=puzzle[0]):
-
-leftx=[left,"left"]
-
-stack.insert(0, leftx)
-
-if(puzzle[1]!="up"):
-
-temp=copy.deepcopy(puzzle[0])
-
-down=move(temp, "down")
-
-if(down!=puzzle[0]):
-
-downx=[down,"down"]
-
-stack.insert(0, downx)
-if(puzzle[1]!="left"):
-
-temp=copy.deepcopy(puzzle[0])
-
-right=move(temp, "right")
-
-if(right!=puzzle[0]):
-
-rightx=[right,"right"]
-
-stack.insert(0, rightx)
-
-print('~~~~~~~~~~~~ IDS ~~~~~~~~~~~~')
-
-ids()
+# Blank movements, in the order the search pushes them, and the move that undoes each
+MOVES = ("up", "left", "down", "right")
+REVERSE = {"up": "down", "down": "up", "left": "right", "right": "left"}
+# The same movements as named by the 8-puzzle modules
+MOVE_NAMES = {"U": "up", "L": "left", "D": "down", "R": "right"}
+
+
+# Flatten a grid into a tuple, returning it with its width
+def flatten(grid):
+    return tuple(tile for row in grid for tile in row), len(grid)
+
+
+# Blank moves legal from each position: neighbours[pos] = ((movement, target), ...)
+def blank_neighbours(width):
+    steps = {"up": -width, "left": -1, "down": width, "right": 1}
+    neighbours = []
+    for pos in range(width * width):
+        row, col = divmod(pos, width)
+        legal = {"up": row > 0, "left": col > 0, "down": row < width - 1, "right": col < width - 1}
+        neighbours.append(tuple((movement, pos + steps[movement]) for movement in MOVES if legal[movement]))
+    return neighbours
+
+
+# Whether `target` is reachable from `board` (flat, same tiles); see Puzzle.reachable
+def solvable(board, target, blank=-1):
+    board, target = relabel(board, target, blank)
+    return puzzle_for(board).reachable(board, target)
+
+
+# Move the blank (the grid's -1) in a direction; returns a new grid, or the same one if the move is illegal
+def move(temp, movement, blank=-1):
+    board, width = flatten(temp)
+    pos = board.index(blank)
+    for name, target in blank_neighbours(width)[pos]:
+        if name == movement:
+            board = list(board)
+            board[pos], board[target] = board[target], blank
+            return [board[i:i + width] for i in range(0, len(board), width)]
+    return temp
+
+
+# Iterative deepening search from `start` to `goal` (grids of the same square size).
+# Each iteration is a depth-first search to `limit` driven by an explicit stack of
+# (board, blank position, depth, movement) frames, so there is no recursion and
+# push/pop are O(1). Boards are flat tuples and a child swaps two cells of its parent.
+# Returns (movements from start to goal or None, nodes generated per limit), and
+# (None, []) at once when the goal is unreachable from the start;
+# `stats` is an optional SearchStats with one iteration per limit.
+def iterative_deepening(start, goal, max_depth=100, blank=-1, on_limit=None, stats=None):
+    stats = DISABLED if stats is None else stats
+    track = stats.enabled
+    board, width = flatten(start)
+    target, goal_width = flatten(goal)
+    if goal_width != width or sorted(board) != sorted(target):
+        raise ValueError("start and goal must hold the same tiles on the same board size")
+    if not solvable(board, target, blank):
+        return None, []
+    neighbours = blank_neighbours(width)
+    generated = []
+    path = []
+
+    for limit in range(max_depth + 1):
+        if on_limit is not None:
+            on_limit(limit)
+        count = expanded = duplicates = peak = 0
+        start_ns = time.perf_counter_ns()
+        stack = deque([(board, board.index(blank), 0, None)])
+        found = False
+        while stack:
+            state, pos, depth, movement = stack.pop()
+            if depth:
+                del path[depth - 1:]
+                path.append(movement)
+            if state == target:
+                found = True
+                break
+            if depth == limit:
+                continue
+            expanded += 1
+            back = REVERSE.get(movement)
+            for name, dst in neighbours[pos]:
+                if name == back:
+                    duplicates += 1
+                    continue
+                child = list(state)
+                child[pos], child[dst] = child[dst], blank
+                stack.append((tuple(child), dst, depth + 1, name))
+                count += 1
+            if track and len(stack) > peak:
+                peak = len(stack)
+        generated.append(count)
+        stats.iteration(limit, count, expanded, time.perf_counter_ns() - start_ns)
+        stats.count(duplicates=duplicates)
+        stats.observe(peak)
+        if found:
+            stats.solution(len(path))
+            return path, generated
+    return None, generated
+
+
+# Bidirectional breadth-first search between `start` and `goal`, the same inputs as
+# iterative_deepening, run by bidirectional.bidirectional_bfs on the flattened boards.
+# Returns (movements or None, nodes generated per layer); `stats` gets one iteration
+# per layer and the per-side expansions in details.
+def bidirectional_search(start, goal, blank=-1, stats=None):
+    stats = SearchStats() if stats is None else stats
+    board, width = flatten(start)
+    target, goal_width = flatten(goal)
+    if goal_width != width or sorted(board) != sorted(target):
+        raise ValueError("start and goal must hold the same tiles on the same board size")
+    first = len(stats.iterations)
+    moves = bidirectional_bfs(list(board), stats, list(target), blank)
+    generated = [iteration["generated"] for iteration in stats.iterations[first:]]
+    return (None if moves is None else [MOVE_NAMES[move] for move in moves]), generated
+
+
+def ids(start=None, goal=None, max_depth=100, stats=None, bidirectional=False):
+    start = start or inp
+    goal = goal or out
+    stats = SearchStats() if stats is None else stats
+    if bidirectional:
+        path, generated = bidirectional_search(start, goal, stats=stats)
+    else:
+        path, generated = iterative_deepening(start, goal, max_depth,
+                                              on_limit=lambda limit: print('LIMIT -> ' + str(limit)), stats=stats)
+    if path is None:
+        print("Not found within depth " + str(max_depth) if generated else "Goal unreachable from start")
+        return None
+
+    print("Found")
+    print('Path cost=' + str(len(path)))
+    state = start
+    print("none --> " + str(state))
+    for movement in path:
+        state = move(state, movement)
+        print(movement + " --> " + str(state))
+    print("Nodes generated per limit: " + str(generated))
+    runtime = sum(iteration["ns"] for iteration in stats.iterations) / 1e9
+    print(f"Nodes expanded: {stats.expanded}, peak stack: {stats.peak_frontier}, runtime: {runtime:.6f} seconds")
+    return path
+
+
+if __name__ == "__main__":
+    print('~~~~~~~~~~~~ IDS ~~~~~~~~~~~~')
+
+    ids()
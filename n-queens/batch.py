@@ -0,0 +1,156 @@
+"""Solve many N-Queens instances without prompts, streaming JSONL results.
+
+    python batch.py instances.jsonl --output results.jsonl --workers 8
+    cat instances.jsonl | python batch.py - > results.jsonl
+
+Each input line is a JSON object such as
+    {"id": "a", "n": 1000, "solver": "min_conflicts", "seed": 7}
+    {"n": 4, "initial_state": [1, 3, 0, 2], "solver": "root_hill_climb"}
+`solver` defaults to min_conflicts and `seed` and `id` to the line number.
+A line that is not a JSON object, or whose initial_state does not hold n rows
+in 0..n-1, gets an error record instead of a result.
+One result line is written per instance as soon as it finishes, so output
+order follows completion order. At most --max-pending instances are in
+flight at once, which keeps memory bounded however long the input is.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from solvers import SOLVERS
+
+DEFAULT_SOLVER = "min_conflicts"
+
+
+def _check_initial_state(instance):
+    """Why an instance's initial_state does not fit its n, or None if it does."""
+    board, n = instance.get("initial_state"), instance.get("n")
+    if board is None:
+        return None
+    if not isinstance(board, list) or not all(isinstance(row, int) and not isinstance(row, bool) for row in board):
+        return "initial_state must be a list of integer rows"
+    if len(board) != n:
+        return f"initial_state has {len(board)} queens but n is {n}"
+    if any(not 0 <= row < n for row in board):
+        return f"initial_state rows must be in 0..{n - 1}"
+    return None
+
+
+def read_instances(stream):
+    """Yield instance dicts from a JSONL stream, filling in defaults.
+
+    A malformed line, or an initial_state that does not match n, yields
+    {"id": ..., "error": ...} instead, so one bad line does not stop the batch.
+    """
+    for number, line in enumerate(stream):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            instance = json.loads(line)
+        except ValueError as error:
+            yield {"id": number, "error": f"{type(error).__name__}: {error}"}
+            continue
+        if not isinstance(instance, dict):
+            yield {"id": number, "error": f"expected a JSON object, got {type(instance).__name__}"}
+            continue
+        instance.setdefault("id", number)
+        instance.setdefault("seed", number)
+        instance.setdefault("solver", DEFAULT_SOLVER)
+        if "n" not in instance and "initial_state" in instance:
+            instance["n"] = len(instance["initial_state"])
+        error = _check_initial_state(instance)
+        if error:
+            yield {"id": instance["id"], "error": error}
+            continue
+        yield instance
+
+
+def solve_instance(instance, include_board=True):
+    """Solve one instance; failures are reported in the result instead of raised."""
+    result = {"id": instance["id"], "n": instance.get("n"), "solver": instance["solver"], "seed": instance["seed"]}
+    start = time.perf_counter()
+    try:
+        if instance["solver"] not in SOLVERS:
+            raise ValueError(f"unknown solver {instance['solver']!r}; choose from {', '.join(sorted(SOLVERS))}")
+        solve = SOLVERS[instance["solver"]]
+        outcome = solve(instance["n"], instance["seed"], instance.get("initial_state"))
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+        return result
+
+    result.update(
+        solved=outcome["conflicts"] == 0,
+        conflicts=outcome["conflicts"],
+        steps=outcome["steps"],
+        evaluations=outcome["evaluations"],
+        seconds=time.perf_counter() - start,
+    )
+    if include_board:
+        result["board"] = outcome["board"]
+    return result
+
+
+def solve_batch(instances, out, workers=None, max_pending=None, include_board=True):
+    """Solve `instances` on a process pool, writing each result to `out` as it completes.
+
+    Instances that already carry an "error" (malformed input lines) are written
+    as they are. Returns the number of instances solved to zero conflicts.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    solved = 0
+
+    def emit(futures):
+        nonlocal solved
+        for future in futures:
+            result = future.result()
+            solved += bool(result.get("solved"))
+            out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    pending = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for instance in instances:
+                if "error" in instance:
+                    out.write(json.dumps(instance) + "\n")
+                    continue
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    emit(done)
+                pending.add(pool.submit(solve_instance, instance, include_board))
+        finally:
+            # Results already in flight are written even if reading the input fails
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                emit(done)
+    return solved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="JSONL file of instances, or - for stdin")
+    parser.add_argument("--output", help="JSONL results file (default: stdout)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, help="instances in flight at once (default: 2 x workers)")
+    parser.add_argument("--no-boards", action="store_true", help="leave solution boards out of the results")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        solve_batch(read_instances(source), out, args.workers, args.max_pending, not args.no_boards)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
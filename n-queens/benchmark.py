@@ -0,0 +1,137 @@
+"""Benchmark the N-Queens solvers over a grid of board sizes and seeds.
+
+    python benchmark.py --sizes 8 16 32 --seeds 20 --output results.json
+    python benchmark.py --sizes 8 16 32 --seeds 20 --baseline results.json
+
+Each (solver, N) cell reports success rate, mean steps, cost evaluations per
+second, peak traced memory and p50/p95/p99 time-to-solution over the solved
+seeds. With --baseline the run is compared against an earlier JSON file and
+exits non-zero when a cell got slower or less reliable than --tolerance allows.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from solvers import SOLVERS
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a list, or None when it is empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-q * len(ordered) // 100))  # ceil(q/100 * len)
+    return ordered[int(rank) - 1]
+
+
+def peak_memory(solve, n, seed):
+    """Peak traced allocation in KiB for one run (timed runs are not traced).
+
+    Only this process is traced, so pool-based solvers report the parent's share.
+    """
+    tracemalloc.start()
+    try:
+        solve(n, seed)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def benchmark_cell(name, n, seeds):
+    solve = SOLVERS[name]
+    times, steps, evaluations, solved = [], [], [], 0
+    total_time = 0.0
+    for seed in seeds:
+        start = time.perf_counter()
+        result = solve(n, seed)
+        elapsed = time.perf_counter() - start
+        total_time += elapsed
+        steps.append(result["steps"])
+        evaluations.append(result["evaluations"])
+        if result["conflicts"] == 0:
+            solved += 1
+            times.append(elapsed)
+
+    return {
+        "solver": name,
+        "n": n,
+        "runs": len(seeds),
+        "success_rate": solved / len(seeds),
+        "mean_steps": sum(steps) / len(steps),
+        "evaluations_per_second": sum(evaluations) / total_time if total_time else 0.0,
+        "peak_memory_kib": peak_memory(solve, n, seeds[0]),
+        "time_to_solution": {f"p{q}": percentile(times, q) for q in (50, 95, 99)},
+    }
+
+
+def run_benchmark(solvers, sizes, seeds):
+    results = []
+    for name in solvers:
+        for n in sizes:
+            cell = benchmark_cell(name, n, seeds)
+            tts = cell["time_to_solution"]
+            p50 = f"{tts['p50']:.4f}s" if tts["p50"] is not None else "-"
+            print(f"{name:28} N={n:<6} success {cell['success_rate']:6.1%} | p50 {p50:>10} | "
+                  f"{cell['evaluations_per_second']:12.0f} evals/s | {cell['peak_memory_kib']:9.1f} KiB")
+            results.append(cell)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seeds": list(seeds),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance):
+    """List regressions against a baseline report; each is a human-readable line."""
+    previous = {(r["solver"], r["n"]): r for r in baseline["results"]}
+    regressions = []
+    for cell in current["results"]:
+        old = previous.get((cell["solver"], cell["n"]))
+        if old is None:
+            continue
+        label = f"{cell['solver']} N={cell['n']}"
+        if cell["success_rate"] < old["success_rate"] - tolerance:
+            regressions.append(f"{label}: success rate {old['success_rate']:.1%} -> {cell['success_rate']:.1%}")
+        for q in ("p50", "p95"):
+            before, after = old["time_to_solution"][q], cell["time_to_solution"][q]
+            # Ignore sub-millisecond jitter on cells that solve almost instantly
+            if before and after and after > before * (1 + tolerance) and after - before > 0.001:
+                regressions.append(f"{label}: {q} time-to-solution {before:.4f}s -> {after:.4f}s")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=list(SOLVERS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[8, 16, 32, 64])
+    parser.add_argument("--seeds", type=int, default=10, help="number of seeds per cell (0..SEEDS-1)")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown (default 0.2)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.solvers, args.sizes, range(args.seeds))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"❌ Regression: {line}")
+        if regressions:
+            return 1
+        print("✅ No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
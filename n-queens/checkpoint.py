@@ -0,0 +1,61 @@
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"NQCK"
+VERSION = 2
+# magic, version, n, step, temp, cooling_rate, min_temp, until_solved, has_gauss, gauss_next
+HEADER = struct.Struct("<4sHIQdddBBd")
+RNG_WORDS = 625  # Mersenne Twister state (624 words + position) from random.getstate()
+
+
+def _int_block(values, typecode):
+    block = array(typecode, values)
+    if sys.byteorder != "little":
+        block.byteswap()
+    return block.tobytes()
+
+
+def _read_block(f, typecode, count):
+    block = array(typecode)
+    block.frombytes(f.read(count * block.itemsize))
+    if sys.byteorder != "little":
+        block.byteswap()
+    return block
+
+
+def save_checkpoint(path, board, best_board, temp, step, rng_state, cooling_rate, min_temp, until_solved=True):
+    """Write the annealing state to `path` atomically (temp file + rename)."""
+    version, words, gauss_next = rng_state
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(board), step, temp, cooling_rate, min_temp,
+                            until_solved, gauss_next is not None, gauss_next or 0.0))
+        f.write(_int_block(board, "i"))
+        f.write(_int_block(best_board, "i"))
+        f.write(_int_block(words, "I"))
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path):
+    """Read a checkpoint written by `save_checkpoint` into a dict."""
+    with open(path, "rb") as f:
+        magic, version, n, step, temp, cooling_rate, min_temp, until_solved, has_gauss, gauss_next = \
+            HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an annealing checkpoint")
+        board = _read_block(f, "i", n).tolist()
+        best_board = _read_block(f, "i", n).tolist()
+        words = tuple(_read_block(f, "I", RNG_WORDS))
+    return {
+        "n": n,
+        "board": board,
+        "best_board": best_board,
+        "temp": temp,
+        "step": step,
+        "cooling_rate": cooling_rate,
+        "min_temp": min_temp,
+        "until_solved": bool(until_solved),
+        "rng_state": (3, words, gauss_next if has_gauss else None),
+    }
@@ -0,0 +1,138 @@
+from array import array
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class ConflictTracker:
+    """Row, diagonal and anti-diagonal occupancy counters for a row-per-column board.
+
+    `board[col] = row` as in the solvers. The number of attacking pairs is kept
+    up to date in `cost`, so scoring or applying a single queen move is O(1).
+    """
+
+    def __init__(self, board):
+        n = len(board)
+        self._clear(n)
+        self.board = array("i", board)
+        for col, row in enumerate(self.board):
+            if not 0 <= row < n:
+                raise ValueError(f"row {row} in column {col} is outside 0..{n - 1}")
+            self._add(col, row)
+
+    @classmethod
+    def unplaced(cls, n):
+        """Tracker for an empty board; queens are added one column at a time with `place`."""
+        tracker = cls.__new__(cls)
+        tracker._clear(n)
+        tracker.board = array("i", [-1]) * n  # -1 marks an unplaced column
+        return tracker
+
+    def _clear(self, n):
+        self.n = n
+        self.rows = array("i", [0]) * n
+        self.diags = array("i", [0]) * (2 * n - 1)       # indexed by row - col + n - 1
+        self.anti_diags = array("i", [0]) * (2 * n - 1)  # indexed by row + col
+        self.cost = 0
+
+    def _add(self, col, row):
+        d = row - col + self.n - 1
+        a = row + col
+        self.cost += self.rows[row] + self.diags[d] + self.anti_diags[a]
+        self.rows[row] += 1
+        self.diags[d] += 1
+        self.anti_diags[a] += 1
+
+    def _discard(self, col, row):
+        d = row - col + self.n - 1
+        a = row + col
+        self.rows[row] -= 1
+        self.diags[d] -= 1
+        self.anti_diags[a] -= 1
+        self.cost -= self.rows[row] + self.diags[d] + self.anti_diags[a]
+
+    def attacks(self, col, row):
+        """Number of queens in other columns attacking square (col, row)."""
+        count = self.rows[row] + self.diags[row - col + self.n - 1] + self.anti_diags[row + col]
+        if self.board[col] == row:
+            count -= 3  # the queen standing on the square itself
+        return count
+
+    def delta(self, col, row):
+        """Change in cost if the queen in `col` is moved to `row`."""
+        current = self.board[col]
+        if current == row:
+            return 0
+        return self.attacks(col, row) - self.attacks(col, current)
+
+    def place(self, col, row):
+        """Put a queen on an unplaced column."""
+        self.board[col] = row
+        self._add(col, row)
+        return self.cost
+
+    def move(self, col, row):
+        """Move the queen in `col` to `row` and return the new cost."""
+        current = self.board[col]
+        if current != row:
+            self._discard(col, current)
+            self.board[col] = row
+            self._add(col, row)
+        return self.cost
+
+    def is_attacked(self, col):
+        """True if the queen in `col` is in conflict with any other queen."""
+        return self.attacks(col, self.board[col]) > 0
+
+    def cost_matrix(self):
+        """n×n NumPy array whose [col, row] entry is the cost after moving `col` to `row`.
+
+        Built from views over the counters, so no neighbor boards are created.
+        """
+        n = self.n
+        board = np.frombuffer(self.board, dtype=np.intc)
+        rows = np.frombuffer(self.rows, dtype=np.intc)
+        diags = np.frombuffer(self.diags, dtype=np.intc)
+        anti_diags = np.frombuffer(self.anti_diags, dtype=np.intc)
+
+        # Row `col` of each window view lines up the diagonal counters with rows 0..n-1
+        attacks = rows + sliding_window_view(diags, n)[::-1] + sliding_window_view(anti_diags, n)
+        cols = np.arange(n)
+        own = attacks[cols, board] - 3
+        matrix = attacks - own[:, None] + self.cost
+        matrix[cols, board] = self.cost
+        return matrix
+
+    def best_move(self, vectorized=False):
+        """Steepest-ascent move as (col, row, cost), or None if no move lowers the cost.
+
+        Moves are scanned column by column and row by row, and the first strictly
+        best one wins, matching the order of `get_neighbors`. With `vectorized`
+        the whole move set is scored at once through `cost_matrix`.
+        """
+        n = self.n
+        if vectorized:
+            matrix = self.cost_matrix()
+            col, row = divmod(int(matrix.argmin()), n)
+            best_cost = int(matrix[col, row])
+            if best_cost >= self.cost:
+                return None
+            return col, row, best_cost
+
+        board = self.board
+        rows, diags, anti_diags = self.rows, self.diags, self.anti_diags
+        best = None
+        best_delta = 0
+        for col in range(n):
+            current = board[col]
+            own = rows[current] + diags[current - col + n - 1] + anti_diags[current + col] - 3
+            for row in range(n):
+                if row == current:
+                    continue
+                delta = rows[row] + diags[row - col + n - 1] + anti_diags[row + col] - own
+                if delta < best_delta:
+                    best_delta = delta
+                    best = (col, row)
+        if best is None:
+            return None
+        return best[0], best[1], self.cost + best_delta
@@ -1,41 +1,36 @@
+import multiprocessing
 import random
-import matplotlib.pyplot as plt
-from IPython.display import clear_output
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
 
+from conflict_tracker import ConflictTracker
+
 # 🎚️ You can change this to slow down or speed up the animation
 DELAY = 0.8  # seconds between frames (try 0.3–1.5)
 
 def compute_conflicts(board):
     """Calculate the number of attacking pairs of queens."""
-    conflicts = 0
-    n = len(board)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if board[i] == board[j] or abs(board[i] - board[j]) == abs(i - j):
-                conflicts += 1
-    return conflicts
+    return ConflictTracker(board).cost
 
-def get_best_neighbor(board):
+def get_best_neighbor(board, tracker=None, vectorized=False):
     """Find the neighbor with the fewest conflicts."""
-    n = len(board)
+    if tracker is None:
+        tracker = ConflictTracker(board)
     best_board = board[:]
-    best_conflicts = compute_conflicts(board)
-    
-    for col in range(n):
-        original_row = board[col]
-        for row in range(n):
-            if row != original_row:
-                new_board = board[:]
-                new_board[col] = row
-                new_conflicts = compute_conflicts(new_board)
-                if new_conflicts < best_conflicts:
-                    best_conflicts = new_conflicts
-                    best_board = new_board
+    best = tracker.best_move(vectorized)
+    if best is None:
+        return best_board, tracker.cost
+
+    col, row, best_conflicts = best
+    best_board[col] = row
     return best_board, best_conflicts
 
 def draw_board(board, step, conflicts, restart):
     """Visualize the board using matplotlib (Colab-compatible)."""
+    # Imported here so headless and recorded runs never load matplotlib
+    import matplotlib.pyplot as plt
+    from IPython.display import clear_output
+
     n = len(board)
     clear_output(wait=True)
     plt.figure(figsize=(5, 5))
@@ -47,53 +42,139 @@ def draw_board(board, step, conflicts, restart):
     plt.grid(True)
     
     # Draw queens (red = in conflict, green = safe)
+    tracker = ConflictTracker(board)
     for col in range(n):
-        row = board[col]
-        color = "green"
-        for c2 in range(n):
-            if c2 != col:
-                if board[c2] == row or abs(board[c2] - row) == abs(c2 - col):
-                    color = "red"
-                    break
-        plt.plot(col, row, "o", color=color, markersize=20)
+        color = "red" if tracker.is_attacked(col) else "green"
+        plt.plot(col, board[col], "o", color=color, markersize=20)
     
     plt.show()
     time.sleep(DELAY)
 
-def hill_climbing_visual_all_trials(n, max_restarts=50):
-    """Hill climbing algorithm that visualizes all trials."""
+def hill_climbing_visual_all_trials(n, max_restarts=50, vectorized=False, visualize=True, recorder=None,
+                                    stats=None):
+    """Hill climbing algorithm that visualizes all trials.
+
+    With `visualize=False` nothing is drawn and there are no pauses; pass a
+    `tracefile.TraceRecorder` to log the run for `replay.render_trace` instead.
+    A `stats` dict gets restarts, total steps and cost evaluations.
+    """
+    pause = time.sleep if visualize else (lambda seconds: None)
+    if stats is not None:
+        stats.update(restarts=0, steps=0, evaluations=0)
     for restart in range(1, max_restarts + 1):
         board = [random.randint(0, n - 1) for _ in range(n)]
-        current_conflicts = compute_conflicts(board)
+        tracker = ConflictTracker(board)
+        current_conflicts = tracker.cost
         step = 0
+        if recorder is not None:
+            recorder.board(board, restart)
         
         # Print summary for each restart
         print(f"\n🚀 Starting Restart #{restart}")
-        time.sleep(1)
+        pause(1)
         
         while True:
-            draw_board(board, step, current_conflicts, restart)
-            neighbor, neighbor_conflicts = get_best_neighbor(board)
+            if visualize:
+                draw_board(board, step, current_conflicts, restart)
+            best = tracker.best_move(vectorized)
+            if stats is not None:
+                stats["evaluations"] += n * (n - 1)
             
-            if neighbor_conflicts >= current_conflicts:
+            if best is None:
                 print(f"🔸 Local optimum reached at Restart {restart}, Step {step} (Conflicts = {current_conflicts})")
-                time.sleep(1.5)
+                pause(1.5)
                 break  # Stop exploring this restart
             
-            board = neighbor
-            current_conflicts = neighbor_conflicts
+            col, row, _ = best
+            current_conflicts = tracker.move(col, row)
+            board[col] = row
+            if recorder is not None:
+                recorder.move(col, row)
             step += 1
         
+        if stats is not None:
+            stats["restarts"] = restart
+            stats["steps"] += step
+
         if current_conflicts == 0:
-            draw_board(board, step, 0, restart)
+            if visualize:
+                draw_board(board, step, 0, restart)
             print(f"✅ Solution found after {restart} restarts!")
             return board
         
-        time.sleep(1.0)
+        pause(1.0)
     
     print("\n❌ No solution found after maximum restarts.")
     return None
 
+def climb_restart(n, seed, vectorized=False, stop_event=None):
+    """Run one seeded restart to a local optimum without drawing."""
+    rng = random.Random(seed)
+    board = [rng.randint(0, n - 1) for _ in range(n)]
+    tracker = ConflictTracker(board)
+    start = time.perf_counter()
+    steps = 0
+    cancelled = False
+
+    while True:
+        if stop_event is not None and stop_event.is_set():
+            cancelled = True
+            break
+        best = tracker.best_move(vectorized)
+        if best is None:
+            break
+        col, row, _ = best
+        tracker.move(col, row)
+        steps += 1
+
+    return {
+        "seed": seed,
+        "steps": steps,
+        "conflicts": tracker.cost,
+        "seconds": time.perf_counter() - start,
+        "cancelled": cancelled,
+        "board": tracker.board.tolist(),
+    }
+
+_stop_event = None
+
+def _init_restart_worker(stop_event):
+    global _stop_event
+    _stop_event = stop_event
+
+def _run_restart(n, seed, vectorized):
+    return climb_restart(n, seed, vectorized, _stop_event)
+
+def hill_climbing_parallel(n, max_restarts=50, workers=None, seed=0, vectorized=False):
+    """Random-restart hill climbing with restarts spread over a process pool.
+
+    Restart i uses seed `seed + i`. As soon as one restart reaches zero conflicts
+    the pending restarts are cancelled and the running ones stop at their next
+    step. Returns (board or None, winning seed or None, per-restart stats).
+    """
+    stop_event = multiprocessing.Event()
+    stats = []
+    winner = None
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_restart_worker,
+                             initargs=(stop_event,)) as pool:
+        futures = [pool.submit(_run_restart, n, seed + i, vectorized) for i in range(max_restarts)]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            result = future.result()
+            stats.append(result)
+            if winner is None and result["conflicts"] == 0:
+                winner = result
+                stop_event.set()
+                for other in futures:
+                    other.cancel()
+
+    if winner is None:
+        return None, None, stats
+    return winner["board"], winner["seed"], stats
+
 # Run it
-n = int(input("Enter N for N-Queens: "))
-hill_climbing_visual_all_trials(n)
+if __name__ == "__main__":
+    n = int(input("Enter N for N-Queens: "))
+    hill_climbing_visual_all_trials(n)
@@ -0,0 +1,150 @@
+import random
+import time
+
+import numpy as np
+
+from conflict_tracker import ConflictTracker
+
+
+class ConflictedColumns:
+    """Set of columns with O(1) add, discard and uniform random choice."""
+
+    def __init__(self, cols=()):
+        self.items = []
+        self.index = {}
+        for col in cols:
+            self.add(col)
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, col):
+        if col not in self.index:
+            self.index[col] = len(self.items)
+            self.items.append(col)
+
+    def discard(self, col):
+        i = self.index.pop(col, None)
+        if i is None:
+            return
+        last = self.items.pop()
+        if last != col:
+            self.items[i] = last
+            self.index[last] = i
+
+    def choice(self, rng):
+        return self.items[int(rng.random() * len(self.items))]
+
+
+def greedy_placement(n, rng, max_tries=32):
+    """Place one queen per column on distinct rows, preferring free diagonals.
+
+    Rows are drawn without replacement, so only diagonal conflicts remain; each
+    column tries up to `max_tries` unused rows before settling for the last one.
+    """
+    tracker = ConflictTracker.unplaced(n)
+    diags, anti_diags = tracker.diags, tracker.anti_diags
+    random_ = rng.random
+    free_rows = list(range(n))
+    for col in range(n):
+        remaining = n - col
+        for _ in range(max_tries):
+            i = int(random_() * remaining)
+            row = free_rows[i]
+            if diags[row - col + n - 1] == 0 and anti_diags[row + col] == 0:
+                break
+        tracker.place(col, row)
+        free_rows[i] = free_rows[remaining - 1]
+    return tracker
+
+
+def min_conflicts(n, seed=None, max_steps=None, tracker=None, noise=0.1):
+    """Min-conflicts repair for N-Queens.
+
+    Starts from `greedy_placement` (or the given tracker) and repeatedly moves a
+    random conflicted queen to a least-attacked row in its column, breaking ties
+    at random. A queen with no improving row jumps to a random row with
+    probability `noise`, which breaks the small local minima seen at low N.
+    `max_steps` defaults to 100 * n + 10000 repairs, so boards with no solution
+    (N = 2 or 3) end instead of looping forever.
+    Returns (tracker, stats); `tracker.cost == 0` means solved.
+    """
+    if max_steps is None:
+        max_steps = 100 * n + 10000
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    if tracker is None:
+        tracker = greedy_placement(n, rng)
+    placed = time.perf_counter()
+
+    # NumPy views share memory with the tracker's arrays, so scalar updates made
+    # by tracker.move are visible to the vectorized row scan below.
+    board = np.frombuffer(tracker.board, dtype=np.intc)
+    rows = np.frombuffer(tracker.rows, dtype=np.intc)
+    diags = np.frombuffer(tracker.diags, dtype=np.intc)
+    anti_diags = np.frombuffer(tracker.anti_diags, dtype=np.intc)
+    cols = np.arange(n, dtype=np.intc)
+
+    own_attacks = rows[board] + diags[board - cols + n - 1] + anti_diags[board + cols] - 3
+    conflicted = ConflictedColumns(np.flatnonzero(own_attacks).tolist())
+    initial_conflicts = tracker.cost
+
+    steps = 0
+    while len(conflicted) and steps < max_steps:
+        col = conflicted.choice(rng)
+        if not tracker.is_attacked(col):
+            conflicted.discard(col)  # freed by an earlier move
+            continue
+
+        current = tracker.board[col]
+        attacks = rows + diags[n - 1 - col:2 * n - 1 - col] + anti_diags[col:col + n]
+        attacks[current] -= 3
+        candidates = np.flatnonzero(attacks == attacks.min())
+        if len(candidates) > 1:
+            # Sidestep along plateaus rather than staying put
+            candidates = candidates[candidates != current]
+        row = int(candidates[int(rng.random() * len(candidates))])
+        if attacks[row] >= attacks[current] and rng.random() < noise:
+            row = int(rng.random() * n)
+        tracker.move(col, row)
+        steps += 1
+
+        # Queens sharing a line with the moved queen may have become attacked
+        if row != current:
+            d = row - col
+            if tracker.rows[row] > 1:
+                for other in np.flatnonzero(board == row).tolist():
+                    conflicted.add(other)
+            if tracker.diags[d + n - 1] > 1:
+                for other in np.flatnonzero(board - cols == d).tolist():
+                    conflicted.add(other)
+            if tracker.anti_diags[row + col] > 1:
+                for other in np.flatnonzero(board + cols == row + col).tolist():
+                    conflicted.add(other)
+        if not tracker.is_attacked(col):
+            conflicted.discard(col)
+
+    finished = time.perf_counter()
+    stats = {
+        "n": n,
+        "initial_conflicts": initial_conflicts,
+        "final_conflicts": tracker.cost,
+        "steps": steps,
+        "placement_seconds": placed - start,
+        "repair_seconds": finished - placed,
+        "seconds": finished - start,
+    }
+    return tracker, stats
+
+
+if __name__ == "__main__":
+    n = int(input("Enter N for N-Queens: "))
+    tracker, stats = min_conflicts(n)
+
+    if tracker.cost == 0:
+        print(f"✅ Solution found in {stats['steps']} repair steps!")
+    else:
+        print(f"⚠️ Ended with {tracker.cost} conflicts after {stats['steps']} steps")
+    print(f"Initial conflicts after greedy placement: {stats['initial_conflicts']}")
+    print(f"Placement: {stats['placement_seconds']:.2f}s | Repair: {stats['repair_seconds']:.2f}s | "
+          f"Total: {stats['seconds']:.2f}s")
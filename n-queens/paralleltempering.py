@@ -0,0 +1,121 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from conflict_tracker import ConflictTracker
+
+
+def temperature_ladder(t_max, t_min, size):
+    """Geometric ladder from `t_max` (index 0) down to `t_min`."""
+    if size == 1:
+        return [t_min]
+    ratio = (t_min / t_max) ** (1 / (size - 1))
+    return [t_max * ratio ** i for i in range(size)]
+
+
+def anneal_segment(board, temp, steps, rng_state):
+    """Run `steps` Metropolis moves at a fixed temperature.
+
+    Takes and returns the RNG state so a segment gives the same result whether
+    it runs in this process or in a worker. Returns (board, cost, accepted, rng_state).
+    """
+    rng = random.Random()
+    rng.setstate(rng_state)
+    tracker = ConflictTracker(board)
+    n = tracker.n
+    accepted = 0
+
+    for _ in range(steps):
+        if tracker.cost == 0:
+            break
+        col = rng.randrange(n)
+        row = rng.randrange(n - 1)
+        if row >= tracker.board[col]:
+            row += 1  # skip the queen's current row
+        delta = tracker.delta(col, row)
+        if delta <= 0 or rng.random() < math.exp(-delta / temp):
+            tracker.move(col, row)
+            accepted += 1
+
+    return tracker.board.tolist(), tracker.cost, accepted, rng.getstate()
+
+
+def _run_segment(args):
+    return anneal_segment(*args)
+
+
+def parallel_tempering(initial_state, ladder=8, t_max=100, t_min=0.05, swap_interval=100,
+                       max_steps=100000, processes=None, seed=None):
+    """Replica-exchange annealing for N-Queens.
+
+    `ladder` replicas start from `initial_state` (a board, or N for random boards)
+    at fixed temperatures from `temperature_ladder`. Each round runs
+    `swap_interval` moves per replica, then neighbouring temperatures try to swap
+    boards with probability min(1, exp((1/T_i - 1/T_j)(E_i - E_j))). With
+    `processes` the segments of a round run in a process pool.
+    Returns (best board, best cost, stats).
+    """
+    rng = random.Random(seed)
+    temps = temperature_ladder(t_max, t_min, ladder)
+    if isinstance(initial_state, int):
+        n = initial_state
+        boards = [[rng.randrange(n) for _ in range(n)] for _ in temps]
+    else:
+        boards = [list(initial_state) for _ in temps]
+    costs = [ConflictTracker(board).cost for board in boards]
+    rng_states = [random.Random(rng.random()).getstate() for _ in temps]
+
+    best = min(range(ladder), key=costs.__getitem__)
+    best_board, best_cost = boards[best][:], costs[best]
+    accepted = [0] * ladder
+    proposed = [0] * ladder
+    swap_attempts = [0] * (ladder - 1)
+    swap_accepts = [0] * (ladder - 1)
+    rounds = 0
+
+    pool = ProcessPoolExecutor(max_workers=processes) if processes else None
+    try:
+        while best_cost > 0 and rounds * swap_interval < max_steps:
+            jobs = [(boards[i], temps[i], swap_interval, rng_states[i]) for i in range(ladder)]
+            results = pool.map(_run_segment, jobs) if pool else map(_run_segment, jobs)
+            for i, (board, cost, moves, state) in enumerate(results):
+                boards[i], costs[i], rng_states[i] = board, cost, state
+                accepted[i] += moves
+                proposed[i] += swap_interval
+                if cost < best_cost:
+                    best_board, best_cost = board[:], cost
+            rounds += 1
+
+            # Alternate even and odd pairs so every boundary gets a chance
+            for i in range(rounds % 2, ladder - 1, 2):
+                swap_attempts[i] += 1
+                exponent = (1 / temps[i] - 1 / temps[i + 1]) * (costs[i] - costs[i + 1])
+                if exponent >= 0 or rng.random() < math.exp(exponent):
+                    boards[i], boards[i + 1] = boards[i + 1], boards[i]
+                    costs[i], costs[i + 1] = costs[i + 1], costs[i]
+                    swap_accepts[i] += 1
+    finally:
+        if pool:
+            pool.shutdown()
+
+    stats = {
+        "rounds": rounds,
+        "steps": rounds * swap_interval,
+        "temperatures": temps,
+        "acceptance_rates": [a / p if p else 0.0 for a, p in zip(accepted, proposed)],
+        "swap_rates": [a / t if t else 0.0 for a, t in zip(swap_accepts, swap_attempts)],
+        "final_costs": costs,
+    }
+    return best_board, best_cost, stats
+
+
+if __name__ == "__main__":
+    n = int(input("Enter N for N-Queens: "))
+    board, cost, stats = parallel_tempering(n)
+
+    if cost == 0:
+        print(f"✅ Solution found after {stats['steps']} steps per replica!")
+    else:
+        print(f"⚠️ Best replica ended with {cost} conflicts after {stats['steps']} steps")
+    for temp, rate in zip(stats["temperatures"], stats["acceptance_rates"]):
+        print(f"T={temp:10.4f} | acceptance {rate:.1%}")
@@ -0,0 +1,65 @@
+import sys
+
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation, PillowWriter
+
+from conflict_tracker import ConflictTracker
+from tracefile import read_trace
+
+
+def replay_frames(path, every=1):
+    """Rebuild (label, step, board, conflicts) frames from a trace file.
+
+    Every `every`-th move is kept, plus the first and last board of each run.
+    """
+    n, events = read_trace(path)
+    tracker = None
+    label = step = 0
+    for event in events:
+        if event[0] == "board":
+            if tracker is not None and step % every:
+                yield label, step, tracker.board.tolist(), tracker.cost
+            _, label, board = event
+            tracker = ConflictTracker(board)
+            step = 0
+            yield label, step, board, tracker.cost
+        else:
+            _, col, row = event
+            tracker.move(col, row)
+            step += 1
+            if step % every == 0:
+                yield label, step, tracker.board.tolist(), tracker.cost
+    if tracker is not None and step % every:
+        yield label, step, tracker.board.tolist(), tracker.cost
+
+
+def render_trace(path, output=None, every=1, interval=200):
+    """Animate a trace; saves to `output` (.gif) when given, else returns the animation."""
+    frames = list(replay_frames(path, every))
+    n = len(frames[0][2])
+
+    fig, ax = plt.subplots(figsize=(5, 5))
+
+    def draw(frame):
+        label, step, board, conflicts = frame
+        tracker = ConflictTracker(board)
+        ax.clear()
+        ax.set_title(f"Run {label} | Step {step}\nConflicts: {conflicts}")
+        ax.set_xlim(-0.5, n - 0.5)
+        ax.set_ylim(-0.5, n - 0.5)
+        ax.set_xticks(range(n))
+        ax.set_yticks(range(n))
+        ax.grid(True)
+        colors = ["red" if tracker.is_attacked(col) else "green" for col in range(n)]
+        ax.scatter(range(n), board, c=colors, s=400)
+
+    animation = FuncAnimation(fig, draw, frames=frames, interval=interval)
+    if output is None:
+        return animation
+    animation.save(output, writer=PillowWriter(fps=max(1, 1000 // interval)))
+    plt.close(fig)
+    return None
+
+
+if __name__ == "__main__":
+    render_trace(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "trace.gif")
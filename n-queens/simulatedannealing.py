@@ -1,33 +1,38 @@
 import random
 import math
-import matplotlib.pyplot as plt
-from IPython.display import clear_output
+import numpy as np
 import time
 
+from checkpoint import load_checkpoint, save_checkpoint
+from conflict_tracker import ConflictTracker
+from paralleltempering import parallel_tempering
+
 # You can adjust this delay for visualization speed (0.2–1.0 works well)
 DELAY = 0.5  
 
 def compute_conflicts(board):
     """Count number of attacking pairs of queens."""
-    conflicts = 0
-    n = len(board)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if board[i] == board[j] or abs(board[i] - board[j]) == abs(i - j):
-                conflicts += 1
-    return conflicts
+    return ConflictTracker(board).cost
+
+def random_move(n):
+    """Pick a random (column, row) move for one queen."""
+    col = random.randint(0, n - 1)
+    new_row = random.randint(0, n - 1)
+    return col, new_row
 
 def random_neighbor(board):
     """Generate a random neighboring state by moving one queen."""
-    n = len(board)
     new_board = board[:]
-    col = random.randint(0, n - 1)
-    new_row = random.randint(0, n - 1)
+    col, new_row = random_move(len(board))
     new_board[col] = new_row
     return new_board
 
 def draw_board(board, step, temp, conflicts):
     """Draw the chessboard in Colab-friendly way."""
+    # Imported here so headless and recorded runs never load matplotlib
+    import matplotlib.pyplot as plt
+    from IPython.display import clear_output
+
     n = len(board)
     clear_output(wait=True)
     plt.figure(figsize=(5, 5))
@@ -38,37 +43,89 @@ def draw_board(board, step, temp, conflicts):
     plt.gca().set_yticks(range(n))
     plt.grid(True)
 
+    tracker = ConflictTracker(board)
     for col in range(n):
-        row = board[col]
-        color = "green"
-        for c2 in range(n):
-            if c2 != col and (board[c2] == row or abs(board[c2] - row) == abs(c2 - col)):
-                color = "red"
-                break
-        plt.plot(col, row, "o", color=color, markersize=20)
+        color = "red" if tracker.is_attacked(col) else "green"
+        plt.plot(col, board[col], "o", color=color, markersize=20)
 
     plt.show()
     time.sleep(DELAY)
 
-def simulated_annealing(n, initial_temp=100, cooling_rate=0.99, min_temp=0.001, visualize=True):
-    """Simulated Annealing algorithm for N-Queens."""
-    board = [random.randint(0, n - 1) for _ in range(n)]
-    current_conflicts = compute_conflicts(board)
-    temp = initial_temp
-    step = 0
-
-    best_board = board[:]
-    best_conflicts = current_conflicts
-
-    while temp > min_temp and current_conflicts > 0:
-        neighbor = random_neighbor(board)
-        neighbor_conflicts = compute_conflicts(neighbor)
-        delta = neighbor_conflicts - current_conflicts
+def simulated_annealing(n, initial_temp=100, cooling_rate=0.99, min_temp=0.001, visualize=True,
+                        replicas=1, swap_interval=100, max_steps=100000, processes=None, recorder=None,
+                        stats=None, checkpoint_path=None, checkpoint_every=100000, resume_from=None,
+                        until_solved=True):
+    """Simulated Annealing algorithm for N-Queens.
+
+    With `replicas` > 1 it runs replica exchange over a temperature ladder from
+    `initial_temp` to `min_temp` instead of a single cooling schedule. Pass a
+    `tracefile.TraceRecorder` to log accepted moves for later replay. A `stats`
+    dict gets steps and cost evaluations.
+
+    With `checkpoint_path` the full state (boards, temperature, step, the
+    `random` module's state and `until_solved`) is saved every
+    `checkpoint_every` steps; `resume_annealing` continues such a run exactly
+    where it stopped. Checkpointing covers the single-chain mode only, so it
+    raises ValueError together with `replicas` > 1.
+
+    With `until_solved=False` a single chain keeps going after it reaches zero
+    conflicts, so the run always lasts the whole cooling schedule (for timing).
+    """
+    if replicas > 1:
+        if checkpoint_path or resume_from is not None:
+            raise ValueError("checkpointing is only supported with replicas=1")
+        board, conflicts, exchange = parallel_tempering(
+            n, ladder=replicas, t_max=initial_temp, t_min=min_temp, swap_interval=swap_interval,
+            max_steps=max_steps, processes=processes, seed=random.getrandbits(64))
+        for temp, rate in zip(exchange["temperatures"], exchange["acceptance_rates"]):
+            print(f"🌡️ T={temp:.4f} | acceptance {rate:.1%}")
+        if conflicts == 0:
+            print(f"✅ Solution found in {exchange['steps']} steps per replica!")
+        else:
+            print(f"⚠️ Ended with {conflicts} conflicts after {exchange['steps']} steps per replica")
+        if stats is not None:
+            stats.update(steps=exchange["steps"], evaluations=exchange["steps"] * replicas)
+        if visualize:
+            draw_board(board, exchange["steps"], min_temp, conflicts)
+        return board
+
+    if resume_from is None:
+        board = [random.randint(0, n - 1) for _ in range(n)]
+        temp = initial_temp
+        step = 0
+        best_board = board[:]
+    else:
+        random.setstate(resume_from["rng_state"])
+        board = resume_from["board"][:]
+        temp = resume_from["temp"]
+        step = resume_from["step"]
+        best_board = resume_from["best_board"][:]
+    tracker = ConflictTracker(board)
+    current_conflicts = tracker.cost
+    best_conflicts = ConflictTracker(best_board).cost
+    first_step = step
+    checkpoint_seconds = 0.0
+    checkpoints = 0
+    if recorder is not None:
+        recorder.board(board)
+
+    while temp > min_temp and (current_conflicts > 0 or not until_solved):
+        if checkpoint_path and step % checkpoint_every == 0 and step != first_step:
+            started = time.perf_counter()
+            save_checkpoint(checkpoint_path, board, best_board, temp, step, random.getstate(),
+                            cooling_rate, min_temp, until_solved)
+            checkpoint_seconds += time.perf_counter() - started
+            checkpoints += 1
+
+        col, new_row = random_move(n)
+        delta = tracker.delta(col, new_row)
 
         # Accept neighbor if better OR with probability exp(-Δ/T)
         if delta < 0 or random.random() < math.exp(-delta / temp):
-            board = neighbor
-            current_conflicts = neighbor_conflicts
+            board[col] = new_row
+            current_conflicts = tracker.move(col, new_row)
+            if recorder is not None:
+                recorder.move(col, new_row)
 
             if current_conflicts < best_conflicts:
                 best_board = board[:]
@@ -85,9 +142,97 @@ def simulated_annealing(n, initial_temp=100, cooling_rate=0.99, min_temp=0.001,
     else:
         print(f"⚠️ Ended with {current_conflicts} conflicts after {step} steps (temp={temp:.4f})")
 
-    draw_board(board, step, temp, current_conflicts)
+    if stats is not None:
+        stats.update(steps=step, evaluations=step, checkpoints=checkpoints,
+                     checkpoint_seconds=checkpoint_seconds)
+    if visualize:
+        draw_board(board, step, temp, current_conflicts)
     return board
 
+def resume_annealing(path, **kwargs):
+    """Continue a checkpointed `simulated_annealing` run; keyword arguments are passed through."""
+    state = load_checkpoint(path)
+    kwargs.setdefault("checkpoint_path", path)
+    kwargs.setdefault("until_solved", state["until_solved"])
+    return simulated_annealing(state["n"], cooling_rate=state["cooling_rate"], min_temp=state["min_temp"],
+                               resume_from=state, **kwargs)
+
+def simulated_annealing_batch(n, chains=32, initial_temp=100, cooling_rate=0.99, min_temp=0.001, seed=None):
+    """Run `chains` independent annealing chains at once as a chains×n NumPy array.
+
+    Every step each chain proposes one random queen move; delta scoring and the
+    Metropolis test are vectorized over all chains through per-chain row and
+    diagonal counters. Stops when any chain reaches zero conflicts.
+    Returns (best board, stats).
+    """
+    rng = np.random.default_rng(seed)
+    k = chains
+    chain = np.arange(k)
+    cols = np.arange(n)
+    boards = rng.integers(0, n, size=(k, n))
+
+    # Per-chain occupancy counters, offset so one bincount fills every chain
+    rows = np.bincount((boards + chain[:, None] * n).ravel(), minlength=k * n).reshape(k, n)
+    lines = 2 * n - 1
+    diags = np.bincount((boards - cols + n - 1 + chain[:, None] * lines).ravel(),
+                        minlength=k * lines).reshape(k, lines)
+    anti_diags = np.bincount((boards + cols + chain[:, None] * lines).ravel(),
+                             minlength=k * lines).reshape(k, lines)
+    costs = sum((c * (c - 1) // 2).sum(axis=1) for c in (rows, diags, anti_diags))
+
+    best_boards = boards.copy()
+    best_costs = costs.copy()
+    accepted = 0
+    temp = initial_temp
+    step = 0
+
+    while temp > min_temp and best_costs.min() > 0:
+        col = rng.integers(0, n, size=k)
+        new_row = rng.integers(0, n, size=k)
+        current = boards[chain, col]
+
+        new_attacks = rows[chain, new_row] + diags[chain, new_row - col + n - 1] + anti_diags[chain, new_row + col]
+        old_attacks = rows[chain, current] + diags[chain, current - col + n - 1] + anti_diags[chain, current + col] - 3
+        delta = np.where(new_row == current, 0, new_attacks - old_attacks)
+
+        # Accept neighbor if better OR with probability exp(-Δ/T), chain by chain
+        accept = (delta < 0) | (rng.random(k) < np.exp(-np.maximum(delta, 0) / temp))
+        accepted += int(accept.sum())
+        moved = chain[accept & (new_row != current)]
+        if len(moved):
+            c, old, new = col[moved], current[moved], new_row[moved]
+            rows[moved, old] -= 1
+            diags[moved, old - c + n - 1] -= 1
+            anti_diags[moved, old + c] -= 1
+            rows[moved, new] += 1
+            diags[moved, new - c + n - 1] += 1
+            anti_diags[moved, new + c] += 1
+            boards[moved, c] = new
+            costs[moved] += delta[moved]
+
+            improved = costs < best_costs
+            best_boards[improved] = boards[improved]
+            best_costs[improved] = costs[improved]
+
+        temp *= cooling_rate
+        step += 1
+
+    best_chain = int(best_costs.argmin())
+    stats = {
+        "chains": k,
+        "steps": step,
+        "best_chain": best_chain,
+        "conflicts": int(best_costs[best_chain]),
+        "acceptance_rate": accepted / (k * step) if step else 0.0,
+        "final_temp": temp,
+    }
+    if stats["conflicts"] == 0:
+        print(f"✅ Solution found by chain {best_chain} in {step} steps!")
+    else:
+        print(f"⚠️ Best chain ended with {stats['conflicts']} conflicts after {step} steps (temp={temp:.4f})")
+    return best_boards[best_chain].tolist(), stats
+
 # Run it
-n = int(input("Enter N for N-Queens: "))
-simulated_annealing(n)
+if __name__ == "__main__":
+    n = int(input("Enter N for N-Queens: "))
+    simulated_annealing(n)
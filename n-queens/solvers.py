@@ -0,0 +1,133 @@
+"""Uniform entry points for every N-Queens solver in the repo.
+
+Each solver is called as `solve(n, seed, initial_state=None)` and returns a dict
+with the final `board`, its `conflicts`, and the `steps` and cost `evaluations`
+it used. Printing is silenced so results can be collected in bulk.
+"""
+import contextlib
+import importlib.util
+import os
+import random
+
+from conflict_tracker import ConflictTracker
+from hillclimbing import hill_climbing_visual_all_trials, hill_climbing_parallel
+from minconflicts import min_conflicts
+from paralleltempering import parallel_tempering
+from simulatedannealing import simulated_annealing, simulated_annealing_batch
+from tabu import tabu_search
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_root_module(name):
+    """Import one of the root-level scripts, which share file names with this directory."""
+    spec = importlib.util.spec_from_file_location(f"root_{name}", os.path.join(ROOT, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+root_hillclimbing = _load_root_module("hillclimbing")
+root_simulatedannealing = _load_root_module("simulatedannealing")
+
+
+@contextlib.contextmanager
+def _quiet():
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def _random_board(n, seed):
+    rng = random.Random(seed)
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def _result(board, steps, evaluations):
+    board = list(board)
+    return {"board": board, "conflicts": ConflictTracker(board).cost, "steps": steps, "evaluations": evaluations}
+
+
+def _no_initial_state(name, initial_state):
+    if initial_state is not None:
+        raise ValueError(f"{name} generates its own boards and does not take an initial state")
+
+
+def root_hill_climb(n, seed, initial_state=None):
+    stats = {}
+    board, _ = root_hillclimbing.hill_climb(initial_state or _random_board(n, seed), vectorized=n >= 64,
+                                            verbose=False, stats=stats)
+    return _result(board, stats["steps"], stats["evaluations"])
+
+
+def root_simulated_annealing(n, seed, initial_state=None):
+    stats = {}
+    random.seed(seed)
+    board, _ = root_simulatedannealing.simulated_annealing(initial_state or _random_board(n, seed),
+                                                           verbose=False, stats=stats)
+    return _result(board, stats["steps"], stats["evaluations"])
+
+
+def nqueens_hill_climbing(n, seed, initial_state=None):
+    _no_initial_state("nqueens_hill_climbing", initial_state)
+    stats = {}
+    random.seed(seed)
+    with _quiet():
+        board = hill_climbing_visual_all_trials(n, vectorized=n >= 64, visualize=False, stats=stats)
+    if board is None:
+        board = [0] * n  # no restart reached zero conflicts; report it as failed
+    return _result(board, stats["steps"], stats["evaluations"])
+
+
+def nqueens_simulated_annealing(n, seed, initial_state=None):
+    _no_initial_state("nqueens_simulated_annealing", initial_state)
+    stats = {}
+    random.seed(seed)
+    with _quiet():
+        board = simulated_annealing(n, visualize=False, stats=stats)
+    return _result(board, stats["steps"], stats["evaluations"])
+
+
+def parallel_restarts(n, seed, initial_state=None):
+    _no_initial_state("parallel_restarts", initial_state)
+    board, _, restarts = hill_climbing_parallel(n, seed=seed, vectorized=n >= 64)
+    if board is None:
+        board = min(restarts, key=lambda r: r["conflicts"])["board"]
+    steps = sum(r["steps"] for r in restarts)
+    return _result(board, steps, (steps + len(restarts)) * n * (n - 1))
+
+
+def annealing_batch(n, seed, initial_state=None):
+    _no_initial_state("annealing_batch", initial_state)
+    with _quiet():
+        board, stats = simulated_annealing_batch(n, seed=seed)
+    return _result(board, stats["steps"], stats["steps"] * stats["chains"])
+
+
+def replica_exchange(n, seed, initial_state=None):
+    ladder = 8
+    board, _, stats = parallel_tempering(initial_state or n, ladder=ladder, seed=seed)
+    return _result(board, stats["steps"], stats["steps"] * ladder)
+
+
+def min_conflicts_repair(n, seed, initial_state=None):
+    tracker = ConflictTracker(initial_state) if initial_state is not None else None
+    tracker, stats = min_conflicts(n, seed=seed, tracker=tracker)
+    return _result(tracker.board, stats["steps"], stats["steps"] * n)
+
+
+def tabu(n, seed, initial_state=None):
+    board, _, stats = tabu_search(initial_state or n, seed=seed, max_steps=100 * n + 1000)
+    return _result(board, stats["steps"], stats["evaluations"])
+
+
+SOLVERS = {
+    "root_hill_climb": root_hill_climb,
+    "root_simulated_annealing": root_simulated_annealing,
+    "nqueens_hill_climbing": nqueens_hill_climbing,
+    "nqueens_simulated_annealing": nqueens_simulated_annealing,
+    "parallel_restarts": parallel_restarts,
+    "annealing_batch": annealing_batch,
+    "replica_exchange": replica_exchange,
+    "min_conflicts": min_conflicts_repair,
+    "tabu_search": tabu,
+}
@@ -0,0 +1,103 @@
+import random
+import time
+
+from conflict_tracker import ConflictTracker
+
+
+class TabuList:
+    """The last `tenure` (col, row) moves in a ring buffer, with hashed O(1) membership.
+
+    A move can sit in the ring more than once, so membership is a count per key.
+    """
+
+    def __init__(self, tenure):
+        self.ring = [None] * tenure
+        self.head = 0
+        self.counts = {}
+
+    def add(self, move):
+        oldest = self.ring[self.head]
+        if oldest is not None:
+            left = self.counts[oldest] - 1
+            if left:
+                self.counts[oldest] = left
+            else:
+                del self.counts[oldest]
+        self.ring[self.head] = move
+        self.counts[move] = self.counts.get(move, 0) + 1
+        self.head = (self.head + 1) % len(self.ring)
+
+    def __contains__(self, move):
+        return move in self.counts
+
+
+def tabu_search(initial_state, tenure=None, max_steps=100000, seed=None):
+    """Tabu search for N-Queens on the row-per-column board.
+
+    Every step moves one queen from a conflicted column to the best row by
+    incremental delta, even if that makes things worse. Moving a queen back to
+    a row it just left is tabu for `tenure` steps unless the move beats the best
+    cost seen so far (aspiration). `initial_state` is a board, or N for a random one.
+    Returns (best board, best cost, stats).
+    """
+    rng = random.Random(seed)
+    if isinstance(initial_state, int):
+        initial_state = [rng.randrange(initial_state) for _ in range(initial_state)]
+    tracker = ConflictTracker(initial_state)
+    n = tracker.n
+    tabu = TabuList(tenure or 10 + n // 10)
+    start = time.perf_counter()
+
+    best_board, best_cost = tracker.board.tolist(), tracker.cost
+    steps = evaluations = aspirations = 0
+
+    while tracker.cost > 0 and steps < max_steps:
+        moves = []
+        best_delta = None
+        for col in range(n):
+            if not tracker.is_attacked(col):
+                continue
+            current = tracker.board[col]
+            for row in range(n):
+                if row == current:
+                    continue
+                delta = tracker.delta(col, row)
+                evaluations += 1
+                if best_delta is not None and delta > best_delta:
+                    continue
+                if (col, row) in tabu and tracker.cost + delta >= best_cost:
+                    continue
+                if best_delta is None or delta < best_delta:
+                    best_delta = delta
+                    moves = []
+                moves.append((col, row))
+
+        if not moves:
+            break  # every move is tabu; only possible with a very long tenure
+
+        col, row = moves[int(rng.random() * len(moves))]
+        if (col, row) in tabu:
+            aspirations += 1
+        tabu.add((col, tracker.board[col]))
+        tracker.move(col, row)
+        steps += 1
+        if tracker.cost < best_cost:
+            best_board, best_cost = tracker.board.tolist(), tracker.cost
+
+    stats = {
+        "steps": steps,
+        "evaluations": evaluations,
+        "aspirations": aspirations,
+        "seconds": time.perf_counter() - start,
+    }
+    return best_board, best_cost, stats
+
+
+if __name__ == "__main__":
+    n = int(input("Enter N for N-Queens: "))
+    board, cost, stats = tabu_search(n)
+
+    if cost == 0:
+        print(f"✅ Solution found in {stats['steps']} steps ({stats['seconds']:.3f}s)!")
+    else:
+        print(f"⚠️ Best board has {cost} conflicts after {stats['steps']} steps")
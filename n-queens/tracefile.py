@@ -0,0 +1,123 @@
+import contextlib
+import io
+import random
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+MAGIC = b"NQTR"
+VERSION = 1
+HEADER = struct.Struct("<4sHI")  # magic, version, n
+BOARD = -1  # record tag: (BOARD, label) followed by n rows
+
+
+class TraceRecorder:
+    """Append-only binary log of a solver run.
+
+    The file is a header followed by int32 records: `(col, row)` for a queen
+    move, or `(-1, label)` followed by a full board when a run (re)starts.
+    Records are buffered in an array and written in large blocks.
+    """
+
+    def __init__(self, path, n, buffer_size=1 << 16):
+        self.n = n
+        self.buffer_size = buffer_size
+        self.buffer = array("i")
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, n))
+
+    def board(self, board, label=0):
+        self.buffer.append(BOARD)
+        self.buffer.append(label)
+        self.buffer.extend(board)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def move(self, col, row):
+        buffer = self.buffer
+        buffer.append(col)
+        buffer.append(row)
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if sys.byteorder != "little":
+            self.buffer.byteswap()
+        self.buffer.tofile(self.file)
+        del self.buffer[:]
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_trace(path):
+    """Return (n, events) where events yields ("board", label, board) and ("move", col, row)."""
+    with open(path, "rb") as f:
+        magic, version, n = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an N-Queens trace file")
+        records = array("i")
+        records.frombytes(f.read())
+    if sys.byteorder != "little":
+        records.byteswap()
+
+    def events():
+        i = 0
+        while i < len(records):
+            if records[i] == BOARD:
+                yield "board", records[i + 1], records[i + 2:i + 2 + n].tolist()
+                i += 2 + n
+            else:
+                yield "move", records[i], records[i + 1]
+                i += 2
+
+    return n, events()
+
+
+def measure_overhead(n=64, steps=200000, seed=0, repeats=5):
+    """Best-of-`repeats` time for the same seeded annealing run with and without a recorder.
+
+    The runs ignore zero-conflict boards and cool for the whole schedule, so
+    each one takes about `steps` moves; the exact count is returned as
+    timings["steps"].
+    """
+    from simulatedannealing import simulated_annealing
+
+    cooling_rate = 0.001 ** (1 / steps)  # reach min_temp after about `steps` steps
+    timings = {"plain": float("inf"), "recorded": float("inf")}
+    counts = set()
+    for _ in range(repeats):
+        for label in ("plain", "recorded"):
+            random.seed(seed)
+            stats = {}
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                if label == "plain":
+                    simulated_annealing(n, initial_temp=1, cooling_rate=cooling_rate, visualize=False,
+                                        stats=stats, until_solved=False)
+                else:
+                    with tempfile.NamedTemporaryFile(suffix=".nqtr") as tmp:
+                        with TraceRecorder(tmp.name, n) as recorder:
+                            simulated_annealing(n, initial_temp=1, cooling_rate=cooling_rate, visualize=False,
+                                                recorder=recorder, stats=stats, until_solved=False)
+            timings[label] = min(timings[label], time.perf_counter() - start)
+            counts.add(stats["steps"])
+    assert len(counts) == 1, f"runs took different step counts: {sorted(counts)}"
+    timings["steps"] = counts.pop()
+    return timings["recorded"] / timings["plain"] - 1, timings
+
+
+if __name__ == "__main__":
+    overhead, timings = measure_overhead()
+    print(f"Steps: {timings['steps']} | Plain: {timings['plain']:.3f}s | Recorded: {timings['recorded']:.3f}s | "
+          f"Overhead: {overhead:.1%}")
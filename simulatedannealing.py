@@ -1,63 +1,105 @@
+import os
 import random
 import math
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "n-queens"))
+from conflict_tracker import ConflictTracker
+from paralleltempering import parallel_tempering
 
 # Heuristic: number of pairs of queens attacking each other
 def calculate_cost(state):
-    cost = 0
-    n = len(state)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if state[i] == state[j] or abs(state[i] - state[j]) == abs(i - j):
-                cost += 1
-    return cost
+    return ConflictTracker(state).cost
 
 
-# Generate all neighbors of the current state
+# Generate all neighbors of the current state (lazily, one copy per neighbor)
 def get_neighbors(state):
-    neighbors = []
     n = len(state)
     for col in range(n):
         for row in range(n):
             if state[col] != row:  # move queen in col to new row
                 neighbor = state.copy()
                 neighbor[col] = row
-                neighbors.append(neighbor)
-    return neighbors
+                yield neighbor
+
+
+# Sample one neighbor move as (col, row) without building the neighbors.
+# Index k picks the same move as the k-th state yielded by get_neighbors.
+def random_move(state):
+    n = len(state)
+    k = random.randrange(n * (n - 1))
+    col, row = divmod(k, n - 1)
+    if row >= state[col]:
+        row += 1  # skip the queen's current row
+    return col, row
+
+
+# Copy of the state with the move applied
+def apply_move(state, move):
+    col, row = move
+    neighbor = state.copy()
+    neighbor[col] = row
+    return neighbor
 
 
 # Simulated Annealing algorithm
-def simulated_annealing(initial_state, initial_temp=100, cooling_rate=0.95, max_iter=1000):
-    current = initial_state
-    current_cost = calculate_cost(current)
+# With verbose=False nothing is printed; a `stats` dict gets steps and cost evaluations.
+def simulated_annealing(initial_state, initial_temp=100, cooling_rate=0.95, max_iter=1000,
+                        replicas=1, swap_interval=100, processes=None, verbose=True, stats=None):
+    # Replica-exchange mode: a ladder of fixed temperatures instead of one schedule
+    if replicas > 1:
+        current, current_cost, exchange = parallel_tempering(
+            initial_state, ladder=replicas, t_max=initial_temp, swap_interval=swap_interval,
+            max_steps=max_iter, processes=processes, seed=random.getrandbits(64))
+        if verbose:
+            for temp, rate in zip(exchange["temperatures"], exchange["acceptance_rates"]):
+                print(f"Temperature = {temp:.4f}, Acceptance rate = {rate:.1%}")
+            print(f"Final state: {current}, Cost = {current_cost}")
+        if stats is not None:
+            stats["steps"] = exchange["steps"]
+            stats["evaluations"] = exchange["steps"] * replicas
+        return current, current_cost
+
+    tracker = ConflictTracker(initial_state)
+    current = list(initial_state)
+    current_cost = tracker.cost
     temperature = initial_temp
 
-    print(f"Initial state: {current}, Cost = {current_cost}, Temperature = {temperature}")
+    if verbose:
+        print(f"Initial state: {current}, Cost = {current_cost}, Temperature = {temperature}")
 
+    steps = 0
     for iteration in range(max_iter):
-        # Generate neighbors and calculate their costs
-        neighbors = get_neighbors(current)
-        next_state = random.choice(neighbors)
-        next_cost = calculate_cost(next_state)
+        # Sample a neighbor move and score it from the conflict counters
+        col, row = random_move(current)
+        steps += 1
 
         # Calculate the difference in energy (deltaE)
-        deltaE = next_cost - current_cost
+        deltaE = tracker.delta(col, row)
 
-        # Accept the move with the Metropolis criterion
+        # Accept the move with the Metropolis criterion (the state is copied only here)
         if deltaE < 0 or random.random() < math.exp(-deltaE / temperature):
-            current = next_state
-            current_cost = next_cost
-            print(f"Move to: {current}, Cost = {current_cost}, deltaE = {deltaE}, Temperature = {temperature}")
+            current = apply_move(current, (col, row))
+            current_cost = tracker.move(col, row)
+            if verbose:
+                print(f"Move to: {current}, Cost = {current_cost}, deltaE = {deltaE}, Temperature = {temperature}")
 
         # Decrease the temperature
         temperature *= cooling_rate
 
         # If the cost is 0, solution is found
         if current_cost == 0:
-            print(f"Final state: {current}, Cost = {current_cost}")
-            print("✅ Goal state reached!")
-            return current, current_cost
+            if verbose:
+                print(f"Final state: {current}, Cost = {current_cost}")
+                print("✅ Goal state reached!")
+            break
+    else:
+        if verbose:
+            print("❌ Solution not found within maximum iterations.")
 
-    print("❌ Solution not found within maximum iterations.")
+    if stats is not None:
+        stats["steps"] = steps
+        stats["evaluations"] = steps
     return current, current_cost
 
 